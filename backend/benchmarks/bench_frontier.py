@@ -0,0 +1,67 @@
+"""
+Micro-benchmark for the crawl frontier.
+
+Fills a frontier with N URLs, then times a fixed batch of the operations the
+crawler runs per page: membership checks for extracted links, pushes and pops.
+Per-operation cost should stay flat as N grows for CrawlFrontier, while the old
+list-based frontier (list.pop(0) + `in` scans) grows linearly.
+
+Run from backend/:
+    python -m benchmarks.bench_frontier
+    python -m benchmarks.bench_frontier --sizes 1000 100000 1000000 --skip-list-above 100000
+"""
+import argparse
+import time
+
+from controllers.crawl_frontier import CrawlFrontier
+
+
+def make_urls(count: int, offset: int = 0):
+    return [f"https://example.com/section-{i % 97}/page-{i}" for i in range(offset, offset + count)]
+
+
+def bench_list(size: int, ops: int) -> float:
+    to_visit = make_urls(size)
+    probes = make_urls(ops, offset=size)
+
+    start = time.perf_counter()
+    for url in probes:
+        if url not in to_visit:
+            to_visit.append(url)
+        to_visit.pop(0)
+    return (time.perf_counter() - start) / ops
+
+
+def bench_frontier(size: int, ops: int) -> float:
+    frontier = CrawlFrontier()
+    for url in make_urls(size):
+        frontier.push(url)
+    probes = make_urls(ops, offset=size)
+
+    start = time.perf_counter()
+    for url in probes:
+        if url not in frontier:
+            frontier.push(url)
+        frontier.pop()
+    return (time.perf_counter() - start) / ops
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Crawl frontier micro-benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--ops", type=int, default=2_000, help="operations timed per size")
+    parser.add_argument("--skip-list-above", type=int, default=100_000,
+                        help="skip the list baseline above this size (it is quadratic)")
+    args = parser.parse_args()
+
+    print(f"{'frontier size':>14} | {'list ns/op':>12} | {'CrawlFrontier ns/op':>20}")
+    print("-" * 54)
+    for size in args.sizes:
+        list_cost = bench_list(size, args.ops) if size <= args.skip_list_above else None
+        frontier_cost = bench_frontier(size, args.ops)
+        list_col = f"{list_cost * 1e9:12.0f}" if list_cost is not None else f"{'skipped':>12}"
+        print(f"{size:>14,} | {list_col} | {frontier_cost * 1e9:20.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Crawl throughput vs. parse worker processes.
+
+Serves a synthetic site from a separate local process, then crawls it with the
+async engine using 0 (inline), 1, 2, 4 and 8 parse workers and reports pages/sec.
+The crawler caps the pool at the CPU count, so each row shows the pool size used.
+Link and image checks are switched off and host pacing is set to zero, so the run
+measures fetch + parse throughput only, which is what the process pool changes.
+
+Run from backend/:
+    python -m benchmarks.bench_parse_workers
+    python -m benchmarks.bench_parse_workers --pages 400 --workers 0 1 2 4 8 16 --parser html.parser
+"""
+import argparse
+import asyncio
+import multiprocessing
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Tuple
+
+from benchmarks.bench_parsers import synthetic_page
+from controllers.recursive_crawler import RecursiveCrawler
+
+
+def serve_site(port: int, pages: int):
+    def page_body(index: int) -> bytes:
+        # Same heavy synthetic markup as bench_parsers, plus links that chain the site together
+        links = ''.join(f'<a href="/page/{(index * 7 + k) % pages}">Next {k}</a>' for k in range(1, 6))
+        return synthetic_page(index).replace(b'</main>', links.encode() + b'</main>')
+
+    bodies = [page_body(i) for i in range(pages)]
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            try:
+                body = bodies[int(self.path.rstrip('/').rsplit('/', 1)[-1] or 0)]
+            except (ValueError, IndexError):
+                body = bodies[0]
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_HEAD(self):
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    ThreadingHTTPServer(('127.0.0.1', port), Handler).serve_forever()
+
+
+class ParseOnlyCrawler(RecursiveCrawler):
+    def check_broken_links(self, anchors, base_url):
+        return []
+
+    def check_large_images(self, images, base_url):
+        return []
+
+
+def run_crawl(base_url: str, pages: int, workers: int, parser: str, concurrency: int) -> Tuple[int, float]:
+    """Parse pool size actually used and pages/sec"""
+    crawler = ParseOnlyCrawler(parser_backend=parser, parse_workers=workers)
+    crawler.scheduler.min_interval = 0
+    start = time.perf_counter()
+    scraped = asyncio.run(crawler.crawl_website_async(base_url, pages, concurrency, concurrency))
+    return crawler.parse_workers, len(scraped) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parse worker scaling benchmark")
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--workers", type=int, nargs="+", default=[0, 1, 2, 4, 8])
+    parser.add_argument("--parser", default="html.parser", help="HTML parser backend to parse with")
+    parser.add_argument("--concurrency", type=int, default=16, help="pages fetched at once")
+    parser.add_argument("--port", type=int, default=8799)
+    args = parser.parse_args()
+
+    server = multiprocessing.Process(target=serve_site, args=(args.port, args.pages), daemon=True)
+    server.start()
+    time.sleep(1)
+    base_url = f"http://127.0.0.1:{args.port}/page/0"
+
+    try:
+        results = []
+        for workers in args.workers:
+            results.append((workers, *run_crawl(base_url, args.pages, workers, args.parser, args.concurrency)))
+    finally:
+        server.terminate()
+
+    baseline = results[0][2]
+    print(f"\n{args.pages} pages, parser={args.parser}, {multiprocessing.cpu_count()} CPUs")
+    print(f"{'parse workers':>13} | {'pool size':>9} | {'pages/sec':>9} | {'speedup':>7}")
+    print("-" * 48)
+    for workers, pool_size, pages_per_sec in results:
+        label = "inline" if workers == 0 else str(workers)
+        pool = "inline" if pool_size == 0 else str(pool_size)
+        print(f"{label:>13} | {pool:>9} | {pages_per_sec:9.1f} | {pages_per_sec / baseline:6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Parse + extract benchmark for the HTML parser backends.
+
+Runs extract_page_facts over a corpus of saved pages once per installed backend
+(html.parser, lxml, selectolax). Each backend runs in its own child process so
+peak memory numbers do not bleed into each other. Reported per backend:
+  - ms per page (parse + title/anchors/images/text extraction), timed without tracing
+  - peak Python heap (tracemalloc, in a separate pass; does not see memory allocated inside C parsers)
+  - peak RSS growth over the process baseline during the timed passes (covers C allocations)
+
+Run from backend/:
+    python -m benchmarks.bench_parsers --corpus path/to/saved/pages
+    python -m benchmarks.bench_parsers --synthetic 200
+Save a corpus with e.g. `curl -s https://example.com/ > corpus/example.html`.
+"""
+import argparse
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from controllers.page_facts import PARSER_BACKENDS, extract_page_facts, is_backend_available
+
+
+def synthetic_page(index: int) -> bytes:
+    rng = random.Random(index)
+    nav = ''.join(f'<li><a href="/section/{i}">Section {i}</a></li>' for i in range(40))
+    paragraphs = ''.join(
+        f'<p>Paragraph {i} with <a href="/article/{rng.randrange(10000)}">an inline link</a> '
+        f'and some more text to clean up   across  lines.</p>\n'
+        for i in range(rng.randrange(80, 200))
+    )
+    images = ''.join(
+        f'<img src="/img/photo-{rng.randrange(500)}.jpg" class="content-image" alt="Photo {i}">'
+        for i in range(rng.randrange(5, 30))
+    )
+    page = (
+        f'<!DOCTYPE html><html><head><title>Synthetic page {index}</title>'
+        f'<style>body {{ color: #333; }}</style><script>var tracking = {index};</script></head>'
+        f'<body><header><nav><ul>{nav}</ul></nav></header><main>{paragraphs}{images}</main>'
+        f'<aside>Related</aside><footer><a href="/privacy">Privacy</a></footer></body></html>'
+    )
+    return page.encode('utf-8')
+
+
+def load_corpus(corpus_dir: str, synthetic: int):
+    if corpus_dir:
+        pages = []
+        for name in sorted(os.listdir(corpus_dir)):
+            if name.endswith(('.html', '.htm')):
+                with open(os.path.join(corpus_dir, name), 'rb') as f:
+                    pages.append(f.read())
+        return pages
+    return [synthetic_page(i) for i in range(synthetic)]
+
+
+def run_backend(backend: str, corpus_dir: str, synthetic: int, repeat: int) -> dict:
+    pages = load_corpus(corpus_dir, synthetic)
+    # Warm up imports so they are not counted as parse time or memory
+    extract_page_facts(pages[0], backend)
+
+    # Timed without tracemalloc, which slows allocation-heavy parsers down by a different factor each
+    baseline_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for page in pages:
+            extract_page_facts(page, backend)
+    elapsed = time.perf_counter() - start
+    peak_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # Separate, untimed pass for the heap peak
+    tracemalloc.start()
+    for page in pages:
+        extract_page_facts(page, backend)
+    _, peak_heap = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'backend': backend,
+        'pages': len(pages),
+        'corpus_mb': sum(len(page) for page in pages) / 1024 / 1024,
+        'ms_per_page': elapsed / (len(pages) * repeat) * 1000,
+        'peak_heap_mb': peak_heap / 1024 / 1024,
+        'rss_growth_mb': (peak_rss_kb - baseline_rss_kb) / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTML parser backend benchmark")
+    parser.add_argument("--corpus", help="directory of saved .html pages")
+    parser.add_argument("--synthetic", type=int, default=100, help="pages to generate when no corpus is given")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--backend", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.backend:
+        print(json.dumps(run_backend(args.backend, args.corpus, args.synthetic, args.repeat)))
+        return
+
+    results = []
+    for backend in PARSER_BACKENDS:
+        if not is_backend_available(backend):
+            print(f"{backend}: not installed, skipped")
+            continue
+        command = [sys.executable, "-m", "benchmarks.bench_parsers", "--backend", backend,
+                   "--synthetic", str(args.synthetic), "--repeat", str(args.repeat)]
+        if args.corpus:
+            command += ["--corpus", args.corpus]
+        output = subprocess.run(command, capture_output=True, text=True, check=True).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+
+    if not results:
+        return
+    print(f"corpus: {results[0]['pages']} pages, {results[0]['corpus_mb']:.1f} MB")
+    print(f"{'backend':>12} | {'ms/page':>8} | {'peak heap MB':>12} | {'RSS growth MB':>13}")
+    print("-" * 55)
+    for result in results:
+        print(f"{result['backend']:>12} | {result['ms_per_page']:8.2f} | "
+              f"{result['peak_heap_mb']:12.1f} | {result['rss_growth_mb']:13.1f}")
+
+
+if __name__ == "__main__":
+    main()
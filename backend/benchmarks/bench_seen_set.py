@@ -0,0 +1,79 @@
+"""
+Memory and lookup benchmark for the crawler's seen-sets.
+
+Adds N URLs to a plain set of strings (the default) and to CompactSeenSet at
+64- and 32-bit fingerprints, then reports the memory each one holds (traced
+allocations, including the URL strings a set keeps alive) and the cost of
+membership checks for URLs that are present and URLs that are not. The
+false-positive column counts misses that the structure reported as seen.
+
+Run from backend/:
+    python -m benchmarks.bench_seen_set
+    python -m benchmarks.bench_seen_set --sizes 100000 1000000 --lookups 200000
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+
+from controllers.seen_set import CompactSeenSet
+
+
+def make_urls(count: int, offset: int = 0):
+    return (f"https://example.com/section-{i % 97}/page-{i}?ref=nav" for i in range(offset, offset + count))
+
+
+def build(kind: str, size: int):
+    if kind == "set":
+        seen = set()
+    elif kind == "compact-64":
+        seen = CompactSeenSet(expected_items=size, false_positive_rate=1e-9)
+    else:
+        seen = CompactSeenSet(expected_items=size, false_positive_rate=1e-2)
+
+    for url in make_urls(size):
+        seen.add(url)
+    return seen
+
+
+def measure(kind: str, size: int, lookups: int):
+    gc.collect()
+    tracemalloc.start()
+    seen = build(kind, size)
+    gc.collect()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    hits = list(make_urls(min(lookups, size)))
+    misses = list(make_urls(lookups, offset=size))
+
+    start = time.perf_counter()
+    for url in hits:
+        url in seen
+    hit_cost = (time.perf_counter() - start) / len(hits)
+
+    start = time.perf_counter()
+    false_positives = sum(1 for url in misses if url in seen)
+    miss_cost = (time.perf_counter() - start) / len(misses)
+
+    return memory, hit_cost, miss_cost, false_positives
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Seen-set memory and lookup benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--lookups", type=int, default=100_000, help="lookups timed per size")
+    args = parser.parse_args()
+
+    print(f"{'URLs':>10} | {'structure':>10} | {'memory MB':>10} | {'bytes/URL':>9} | "
+          f"{'hit ns':>7} | {'miss ns':>7} | {'false pos':>9}")
+    print("-" * 82)
+    for size in args.sizes:
+        for kind in ("set", "compact-64", "compact-32"):
+            memory, hit_cost, miss_cost, false_positives = measure(kind, size, args.lookups)
+            print(f"{size:>10,} | {kind:>10} | {memory / 1e6:10.1f} | {memory / size:9.1f} | "
+                  f"{hit_cost * 1e9:7.0f} | {miss_cost * 1e9:7.0f} | {false_positives:>9}")
+
+
+if __name__ == "__main__":
+    main()
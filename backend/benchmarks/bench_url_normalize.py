@@ -0,0 +1,125 @@
+"""
+Link extraction benchmark: resolve, filter and normalize every anchor of a page.
+
+Compares the previous per-anchor path (urljoin + urlparse + normalize on every
+href, extension filter via substring scans) with url_normalizer.normalize_links,
+which memoizes resolution per (base, href) and normalization per URL. The
+anchor corpus mimics a real site: a shared header/footer nav on every page,
+breadcrumbs, in-content links with relative, root-relative, absolute and
+protocol-relative forms, plus mailto/tel/javascript/fragment/file links.
+Both paths must return the same set of links for every page.
+
+Run from backend/:
+    python -m benchmarks.bench_url_normalize
+    python -m benchmarks.bench_url_normalize --pages 5000 --corpus path/to/saved/pages
+"""
+import argparse
+import os
+import random
+import time
+from urllib.parse import urljoin, urlparse
+
+from controllers import url_normalizer
+from controllers.page_facts import extract_page_facts
+
+DOMAIN = "www.example.com"
+
+
+def synthetic_anchors(index: int):
+    """(page URL, hrefs) for one page of a synthetic site"""
+    rng = random.Random(index)
+    section = rng.randrange(20)
+    page_url = f"https://{DOMAIN}/blog/section-{section}/post-{index}/"
+
+    header = [f"/section-{i}/" for i in range(25)] + ["/", "/about", "/contact", "#main", "javascript:void(0)"]
+    footer = ["/privacy", "/terms", "mailto:hello@example.com", "tel:+15550100",
+              "https://twitter.com/example", "https://www.facebook.com/example",
+              f"https://{DOMAIN}/careers", "//cdn.example.com/brochure.pdf"]
+    breadcrumbs = ["../", "../../", f"/blog/section-{section}/"]
+    content = []
+    for _ in range(rng.randrange(15, 60)):
+        target = rng.randrange(5000)
+        form = rng.randrange(5)
+        if form == 0:
+            content.append(f"../post-{target}/")
+        elif form == 1:
+            content.append(f"/blog/section-{target % 20}/post-{target}/?utm_source=blog&ref=related")
+        elif form == 2:
+            content.append(f"https://{DOMAIN}/blog/section-{target % 20}/post-{target}/#comments")
+        elif form == 3:
+            content.append(f"/files/report-{target}.PDF")
+        else:
+            content.append(f"//{DOMAIN}/tags/tag-{target % 300}")
+    return page_url, header + breadcrumbs + content + footer
+
+
+def load_corpus(corpus_dir: str, pages: int):
+    if not corpus_dir:
+        return [synthetic_anchors(i) for i in range(pages)]
+
+    corpus = []
+    for name in sorted(os.listdir(corpus_dir)):
+        if name.endswith(('.html', '.htm')):
+            with open(os.path.join(corpus_dir, name), 'rb') as f:
+                facts = extract_page_facts(f.read())
+            corpus.append((f"https://{DOMAIN}/{name}", [href for href, _ in facts.anchors]))
+    return corpus
+
+
+def previous_extract_links(base_url: str, hrefs, domain: str):
+    """Link extraction as RecursiveCrawler.extract_links did it before memoization"""
+    links = []
+    for href in hrefs:
+        if not href or href.startswith(('javascript:', 'mailto:', 'tel:', '#')):
+            continue
+        try:
+            full_url = urljoin(base_url, href)
+            normalized_url = url_normalizer.normalize_url.__wrapped__(full_url)
+            if (urlparse(full_url).netloc == domain and
+                not any(ext in full_url.lower() for ext in ['.pdf', '.jpg', '.png', '.doc', '.docx', '.zip'])):
+                links.append(normalized_url)
+        except Exception:
+            continue
+    return list(set(links))
+
+
+def run(corpus, extract) -> float:
+    start = time.perf_counter()
+    for page_url, hrefs in corpus:
+        extract(page_url, hrefs, DOMAIN)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="URL normalization / link extraction benchmark")
+    parser.add_argument("--pages", type=int, default=2000, help="synthetic pages (ignored with --corpus)")
+    parser.add_argument("--corpus", help="folder of saved .html pages to take anchors from")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus, args.pages)
+    anchors = sum(len(hrefs) for _, hrefs in corpus)
+
+    for page_url, hrefs in corpus:
+        expected = set(previous_extract_links(page_url, hrefs, DOMAIN))
+        actual = url_normalizer.normalize_links(page_url, hrefs, DOMAIN)
+        assert expected == set(actual) and len(actual) == len(expected), page_url
+
+    url_normalizer.normalize_url.cache_clear()
+    url_normalizer._resolve.cache_clear()
+
+    previous = run(corpus, previous_extract_links)
+    memoized = run(corpus, url_normalizer.normalize_links)
+    stats = url_normalizer.cache_stats()
+    lookups = stats['resolve_hits'] + stats['resolve_misses']
+
+    print(f"{len(corpus):,} pages, {anchors:,} anchors")
+    print(f"{'path':>18} | {'total ms':>9} | {'us/page':>8} | {'ns/anchor':>9}")
+    print("-" * 54)
+    for name, elapsed in (("per-anchor", previous), ("normalize_links", memoized)):
+        print(f"{name:>18} | {elapsed * 1e3:9.1f} | {elapsed / len(corpus) * 1e6:8.1f} | {elapsed / anchors * 1e9:9.0f}")
+    print(f"speedup {previous / memoized:.1f}x, resolve cache hit rate "
+          f"{stats['resolve_hits'] / lookups:.0%} over {lookups:,} lookups")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class CrawlerConfig:
+    # Engine used by RecursiveCrawlerController when the request does not choose one
+    DEFAULT_ENGINE = "sync"
+
+    # Async engine: pages fetched at once across the crawl, and per host
+    MAX_CONCURRENCY = 8
+    PER_HOST_CONCURRENCY = 4
+
+    # Minimum spacing between two requests to the same host (pages, link and image checks)
+    HOST_MIN_INTERVAL_SECONDS = 0.1
+    # Threads checking links/images, shared by all pages of a crawl; different hosts proceed in parallel
+    CHECK_WORKERS = 16
+
+    # robots.txt: honored unless RESPECT_ROBOTS_TXT=false; rules are re-fetched per host after the TTL.
+    # Crawl-delay raises a host's interval, capped so one directive cannot stall a crawl.
+    RESPECT_ROBOTS_TXT = os.getenv("RESPECT_ROBOTS_TXT", "true").lower() != "false"
+    ROBOTS_USER_AGENT = os.getenv("ROBOTS_USER_AGENT", "*")
+    ROBOTS_TTL_SECONDS = int(os.getenv("ROBOTS_TTL_SECONDS", 60 * 60))
+    MAX_CRAWL_DELAY_SECONDS = 10.0
+
+    # Sitemaps: how deep sitemap indexes are followed, how many URLs are read,
+    # child sitemaps fetched at once, and entries buffered ahead of the consumer
+    SITEMAP_MAX_DEPTH = 3
+    SITEMAP_MAX_URLS = int(os.getenv("SITEMAP_MAX_URLS", 50000))
+    SITEMAP_WORKERS = 4
+    SITEMAP_QUEUE_SIZE = 1000
+
+    # Best-first frontier. Lower scores are crawled first:
+    #   depth_weight x depth - priority_weight x sitemap priority (0.5 if none)
+    #   - freshness_weight x freshness (1.0 for a lastmod of today, halving every half-life)
+    #   - inbound_weight x log2(1 + links to the URL seen so far)
+    FRONTIER_DEPTH_WEIGHT = 1.0
+    FRONTIER_SITEMAP_PRIORITY_WEIGHT = 2.0
+    FRONTIER_FRESHNESS_WEIGHT = 1.0
+    FRONTIER_FRESHNESS_HALF_LIFE_DAYS = 30
+    FRONTIER_INBOUND_WEIGHT = 1.0
+
+    # Compact seen-sets: URL fingerprints instead of strings for visited/queued checks
+    # (for very large crawls). Fingerprints are sized for the expected URL count so that
+    # a new URL is mistaken for a seen one at most at this rate.
+    COMPACT_SEEN_SET = os.getenv("CRAWL_COMPACT_SEEN_SET", "false").lower() == "true"
+    SEEN_SET_EXPECTED_URLS = int(os.getenv("SEEN_SET_EXPECTED_URLS", 1_000_000))
+    SEEN_SET_FALSE_POSITIVE_RATE = float(os.getenv("SEEN_SET_FALSE_POSITIVE_RATE", 1e-9))
+
+    # Memoized URL normalization/resolution: entries kept per cache (LRU)
+    URL_CACHE_SIZE = int(os.getenv("URL_CACHE_SIZE", 65536))
+
+    # Image dimension probe: first ranged read, and the most bytes read before giving up
+    IMAGE_PROBE_BYTES = 8 * 1024
+    IMAGE_PROBE_MAX_BYTES = 256 * 1024
+
+    # Keep image dimension checks across crawls, keyed by URL + ETag
+    IMAGE_METADATA_PERSIST = os.getenv("IMAGE_METADATA_PERSIST", "true").lower() != "false"
+
+    # Sizing resources without Content-Length: most bytes streamed before reporting "at least"
+    SIZE_PROBE_MAX_BYTES = 4 * 1024 * 1024
+
+    # Per-host latency tracking: EWMA weight and p95 window. With enough samples a host's read
+    # timeout for link and image checks becomes multiplier x p95 (within floor..caller's timeout);
+    # page fetches keep their own timeout.
+    HOST_STATS_ALPHA = 0.2
+    HOST_STATS_WINDOW = 50
+    ADAPTIVE_TIMEOUT_MIN_SAMPLES = 5
+    ADAPTIVE_TIMEOUT_MULTIPLIER = 4.0
+    ADAPTIVE_TIMEOUT_FLOOR_SECONDS = 2.0
+    CONNECT_TIMEOUT_SECONDS = 3.05
+    DEFAULT_TIMEOUT_SECONDS = 10.0
+
+    # Retries of GET/HEAD on connection errors and 429/502/503/504: attempts in total,
+    # and the exponential backoff (with jitter) between them
+    RETRY_MAX_ATTEMPTS = int(os.getenv("RETRY_MAX_ATTEMPTS", 3))
+    RETRY_BASE_DELAY_SECONDS = 0.5
+    RETRY_MAX_DELAY_SECONDS = 8.0
+
+    # Circuit breaker: consecutive failures that open a host's circuit, and how long
+    # requests to it fail fast before one trial request is let through
+    BREAKER_FAILURE_THRESHOLD = 5
+    BREAKER_RESET_SECONDS = 30.0
+    # A host whose circuit opened this many times in a row (failed trials) is treated as down.
+    # Until then, pages of a host with an open circuit are requeued for when it may close again.
+    BREAKER_MAX_OPENINGS = 3
+
+    # Page downloads are streamed; HTML bodies are read up to this many bytes and the rest is dropped
+    MAX_BODY_BYTES = int(os.getenv("CRAWL_MAX_BODY_BYTES", 5 * 1024 * 1024))
+
+    # Processes parsing pages during an async crawl, at most one per CPU; 0 parses inline in the fetching thread.
+    # Server-side only: crawl requests cannot choose it
+    PARSE_WORKERS = min(int(os.getenv("CRAWL_PARSE_WORKERS", 0)), os.cpu_count() or 1)
+
+    # HTML parser: auto | selectolax | lxml | html.parser (auto picks the fastest installed)
+    HTML_PARSER = os.getenv("HTML_PARSER", "auto")
+
+    # Persistent link-status store: how long a checked link is trusted across crawls
+    LINK_STATUS_TTL_SECONDS = int(os.getenv("LINK_STATUS_TTL_SECONDS", 24 * 60 * 60))
+    LINK_STATUS_NEGATIVE_TTL_SECONDS = int(os.getenv("LINK_STATUS_NEGATIVE_TTL_SECONDS", 60 * 60))
+
+    # Shared HTTP client: host pools kept alive, and connections kept per host
+    HTTP_POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", 32))
+    HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", 32))
+
+    # Distributed crawls: shared SQLite work queue and how long a worker may hold a URL
+    WORK_QUEUE_PATH = os.getenv("CRAWL_QUEUE_PATH", "crawl_queue.db")
+    QUEUE_LEASE_SECONDS = 120
+    QUEUE_MAX_ATTEMPTS = 3
+    QUEUE_POLL_SECONDS = 0.5
+
+    # Background crawl jobs run at once per API process
+    JOB_WORKERS = int(os.getenv("CRAWL_JOB_WORKERS", 2))
+    # API processes sharing the database mark their running jobs alive; a running job
+    # whose heartbeat is older than JOB_STALE_SECONDS is failed by the other processes
+    JOB_HEARTBEAT_SECONDS = 30
+    JOB_STALE_SECONDS = 120
+    # Events buffered per live progress stream; a slow client loses the oldest progress events
+    EVENT_QUEUE_SIZE = 100
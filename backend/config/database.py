@@ -1,11 +1,39 @@
+import os
 from sqlmodel import SQLModel, create_engine, Session
-from sqlalchemy.engine import Engine
+from sqlalchemy import inspect, text, event
+from sqlalchemy.engine import Engine, make_url
 
-sqlite_url = "sqlite:///website_audit.db"
-engine: Engine = create_engine(sqlite_url, connect_args={"check_same_thread": False})
+sqlite_url = os.getenv("DATABASE_URL", "sqlite:///website_audit.db")
+is_sqlite = make_url(sqlite_url).get_backend_name() == "sqlite"
+# sqlite3 options: connections are shared across crawl threads, and writers wait for locks
+connect_args = {"check_same_thread": False, "timeout": 30} if is_sqlite else {}
+engine: Engine = create_engine(sqlite_url, connect_args=connect_args)
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    # WAL lets background crawl jobs write while API requests keep reading
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.close()
+
+if is_sqlite:
+    event.listen(engine, "connect", _set_sqlite_pragmas)
+
+def add_missing_columns():
+    """create_all never alters existing tables, so add new nullable columns to older databases"""
+    inspector = inspect(engine)
+    with engine.begin() as connection:
+        for table in SQLModel.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {column['name'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in existing and column.nullable:
+                    column_type = column.type.compile(dialect=engine.dialect)
+                    connection.execute(text(f'ALTER TABLE "{table.name}" ADD COLUMN "{column.name}" {column_type}'))
 
 def create_db_and_tables():
     SQLModel.metadata.create_all(engine)
+    add_missing_columns()
 
 def get_session():
     with Session(engine) as session:
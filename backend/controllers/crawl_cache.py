@@ -0,0 +1,71 @@
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable
+
+
+class CoalescingCache:
+    """
+    Thread-safe memo of key -> result for the lifetime of a crawl.
+    A lookup for a key that another thread is still computing waits for that
+    result instead of repeating the work, so each distinct key is computed once.
+    Failed computations are not cached.
+    """
+
+    def __init__(self):
+        self._results: Dict[Hashable, Any] = {}
+        self._pending: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        with self._lock:
+            if key in self._results:
+                self.hits += 1
+                return self._results[key]
+
+            future = self._pending.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._pending[key] = future
+                self.misses += 1
+            else:
+                self.coalesced += 1
+
+        if not owner:
+            return future.result()
+
+        try:
+            result = compute()
+        except BaseException as e:
+            with self._lock:
+                del self._pending[key]
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            self._results[key] = result
+            del self._pending[key]
+        future.set_result(result)
+        return result
+
+    def clear(self):
+        with self._lock:
+            self._results.clear()
+            self.hits = 0
+            self.misses = 0
+            self.coalesced = 0
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'entries': len(self._results),
+                'hits': self.hits,
+                'misses': self.misses,
+                'coalesced': self.coalesced
+            }
+
+    def __len__(self) -> int:
+        return len(self._results)
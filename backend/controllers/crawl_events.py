@@ -0,0 +1,56 @@
+import asyncio
+import threading
+from typing import Dict, List, Tuple
+from config.crawler_config import CrawlerConfig
+
+
+class CrawlEventBus:
+    """
+    In-process pub/sub for live crawl progress, keyed by crawl job id.
+    Crawl threads publish, async SSE handlers subscribe. With no subscriber
+    for a job, publish() is a single dict lookup, and callers can skip
+    building the event at all by checking has_subscribers() first.
+    Subscriber queues hold at most `queue_size` events: when a client reads
+    slower than the crawl publishes, the oldest events are dropped. Page events
+    carry cumulative counts, so the newest one is all a late reader needs.
+    """
+
+    def __init__(self, queue_size: int = CrawlerConfig.EVENT_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._subscribers: Dict[int, List[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]]] = {}
+        self._lock = threading.Lock()
+
+    def has_subscribers(self, job_id: int) -> bool:
+        return job_id in self._subscribers
+
+    def publish(self, job_id: int, event: Dict):
+        subscribers = self._subscribers.get(job_id)
+        if not subscribers:
+            return
+        for loop, queue in list(subscribers):
+            loop.call_soon_threadsafe(self._deliver, queue, event)
+
+    @staticmethod
+    def _deliver(queue: asyncio.Queue, event: Dict):
+        """Runs on the subscriber's loop; makes room by dropping the oldest event, so the final status always fits"""
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(event)
+
+    def subscribe(self, job_id: int) -> asyncio.Queue:
+        """Must be called from the subscriber's event loop"""
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        with self._lock:
+            self._subscribers.setdefault(job_id, []).append((asyncio.get_running_loop(), queue))
+        return queue
+
+    def unsubscribe(self, job_id: int, queue: asyncio.Queue):
+        with self._lock:
+            subscribers = [entry for entry in self._subscribers.get(job_id, []) if entry[1] is not queue]
+            if subscribers:
+                self._subscribers[job_id] = subscribers
+            else:
+                self._subscribers.pop(job_id, None)
+
+
+crawl_events = CrawlEventBus()
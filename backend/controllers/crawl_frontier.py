@@ -0,0 +1,184 @@
+import heapq
+import itertools
+import math
+import re
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Set, Tuple, Union
+from urllib.parse import urlparse
+from config.crawler_config import CrawlerConfig
+from controllers.seen_set import CompactSeenSet
+
+# sitemaps.org default for <url> entries without <priority>; also used for discovered links
+DEFAULT_SITEMAP_PRIORITY = 0.5
+
+# W3C Datetime lastmod with year or year-month precision, which fromisoformat rejects
+YEAR_OR_MONTH = re.compile(r'\d{4}(-\d{2})?')
+
+
+def freshness(lastmod: Optional[str], now: Optional[datetime] = None) -> float:
+    """Sitemap lastmod as a 0..1 bonus: 1.0 for today, halving every half-life; 0.0 if missing or unparseable"""
+    if not lastmod:
+        return 0.0
+    value = lastmod.strip()
+    if YEAR_OR_MONTH.fullmatch(value):
+        # Start of the year or month
+        value += '-01-01' if len(value) == 4 else '-01'
+    try:
+        modified = datetime.fromisoformat(value)
+    except ValueError:
+        return 0.0
+    if modified.tzinfo is None:
+        modified = modified.replace(tzinfo=timezone.utc)
+
+    age_days = max(((now or datetime.now(timezone.utc)) - modified).total_seconds() / 86400, 0.0)
+    return 0.5 ** (age_days / CrawlerConfig.FRONTIER_FRESHNESS_HALF_LIFE_DAYS)
+
+
+class FrontierEntry:
+    __slots__ = ('depth', 'sitemap_priority', 'freshness', 'inbound', 'score')
+
+    def __init__(self, depth: int, sitemap_priority: Optional[float], freshness: float, inbound: int):
+        self.depth = depth
+        self.sitemap_priority = sitemap_priority
+        self.freshness = freshness
+        self.inbound = inbound
+        self.score = 0.0
+
+
+class CrawlFrontier:
+    """
+    Best-first queue of URLs waiting to be crawled, with a hash-set membership index.
+    Shallow URLs, URLs the sitemap ranks high or marks as recently modified, and
+    URLs many crawled pages link to come out first; ties keep insertion order,
+    so without those signals the crawl is breadth-first.
+
+    Every URL ever admitted is remembered, so a URL is queued at most once per crawl
+    and `url in frontier` also covers pages that were already popped. Pushing a
+    URL that is still queued merges into its entry (shallowest depth, inbound
+    links added up) and re-ranks it.
+    Pass a CompactSeenSet as `seen` to remember admitted URLs as fingerprints.
+
+    Limits: URLs deeper than `max_depth` are not admitted, and `path_budgets`
+    ({'/tag/': 20, ...}) caps the pages popped under a path prefix (the longest
+    matching prefix counts); URLs over budget are dropped when they come up.
+    """
+
+    def __init__(self, seen: Optional[Union[Set[str], CompactSeenSet]] = None,
+                 max_depth: Optional[int] = None, path_budgets: Optional[Dict[str, int]] = None):
+        self._heap: List[Tuple[float, int, str]] = []
+        self._entries: Dict[str, FrontierEntry] = {}
+        self._order = itertools.count()
+        self._seen = seen if seen is not None else set()
+        self.max_depth = max_depth
+        # Longest prefix first, so the most specific budget applies
+        self.path_budgets = dict(sorted((path_budgets or {}).items(), key=lambda item: len(item[0]), reverse=True))
+        self._budget_used: Dict[str, int] = {}
+        self.over_depth = 0
+        self.over_budget = 0
+
+    @staticmethod
+    def _score(entry: FrontierEntry) -> float:
+        """Lower pops first"""
+        priority = entry.sitemap_priority if entry.sitemap_priority is not None else DEFAULT_SITEMAP_PRIORITY
+        return (CrawlerConfig.FRONTIER_DEPTH_WEIGHT * entry.depth
+                - CrawlerConfig.FRONTIER_SITEMAP_PRIORITY_WEIGHT * priority
+                - CrawlerConfig.FRONTIER_FRESHNESS_WEIGHT * entry.freshness
+                - CrawlerConfig.FRONTIER_INBOUND_WEIGHT * math.log2(1 + entry.inbound))
+
+    def _schedule(self, url: str, entry: FrontierEntry):
+        entry.score = self._score(entry)
+        heapq.heappush(self._heap, (entry.score, next(self._order), url))
+        # Re-ranked entries leave stale heap items behind; rebuild once they dominate
+        if len(self._heap) > 2 * len(self._entries) + 1024:
+            self._heap = [item for item in self._heap
+                          if item[2] in self._entries and self._entries[item[2]].score == item[0]]
+            heapq.heapify(self._heap)
+
+    def push(self, url: str, depth: int = 0, sitemap_priority: Optional[float] = None,
+             lastmod: Optional[str] = None, inbound: int = 0) -> bool:
+        """
+        Queue the URL unless it was admitted before or is deeper than max_depth.
+        `inbound` is the number of links to it this push stands for. Returns True if it was added.
+        """
+        entry = self._entries.get(url)
+        if entry is not None:
+            entry.depth = min(entry.depth, depth)
+            entry.inbound += inbound
+            if sitemap_priority is not None:
+                entry.sitemap_priority = max(entry.sitemap_priority or 0.0, sitemap_priority)
+            entry.freshness = max(entry.freshness, freshness(lastmod))
+            self._schedule(url, entry)
+            return False
+
+        if url in self._seen:
+            return False
+        if self.max_depth is not None and depth > self.max_depth:
+            self.over_depth += 1
+            return False
+
+        self._seen.add(url)
+        entry = self._entries[url] = FrontierEntry(depth, sitemap_priority, freshness(lastmod), inbound)
+        self._schedule(url, entry)
+        return True
+
+    def _budget_prefix(self, url: str) -> Optional[str]:
+        if not self.path_budgets:
+            return None
+        path = urlparse(url).path or '/'
+        return next((prefix for prefix in self.path_budgets if path.startswith(prefix)), None)
+
+    def pop_entry(self) -> Optional[Tuple[str, int]]:
+        """(URL, depth) of the best queued URL, or None once nothing within budget is left"""
+        while self._heap:
+            score, _, url = heapq.heappop(self._heap)
+            entry = self._entries.get(url)
+            if entry is None or entry.score != score:
+                continue
+            del self._entries[url]
+
+            prefix = self._budget_prefix(url)
+            if prefix is not None:
+                used = self._budget_used.get(prefix, 0)
+                if used >= self.path_budgets[prefix]:
+                    self.over_budget += 1
+                    continue
+                self._budget_used[prefix] = used + 1
+            return url, entry.depth
+        return None
+
+    def requeue(self, url: str, depth: int):
+        """Put back a popped URL that could not be crawled yet (its host was unavailable)"""
+        prefix = self._budget_prefix(url)
+        if prefix is not None and self._budget_used.get(prefix):
+            self._budget_used[prefix] -= 1
+        entry = self._entries[url] = FrontierEntry(depth, None, 0.0, 0)
+        self._schedule(url, entry)
+
+    def pop(self) -> Optional[str]:
+        entry = self.pop_entry()
+        return entry[0] if entry else None
+
+    def clear(self):
+        self._heap.clear()
+        self._entries.clear()
+        self._seen.clear()
+        self._budget_used.clear()
+        self.over_depth = 0
+        self.over_budget = 0
+
+    def stats(self) -> Dict:
+        return {
+            'queued': len(self._entries),
+            'over_depth': self.over_depth,
+            'over_budget': self.over_budget,
+            'budget_used': dict(self._budget_used)
+        }
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._seen
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __bool__(self) -> bool:
+        return bool(self._entries)
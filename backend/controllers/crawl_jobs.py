@@ -0,0 +1,194 @@
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+import socket
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+from sqlmodel import Session, select, update, or_
+from config.database import engine
+from config.crawler_config import CrawlerConfig
+from models.crawl_job import CrawlJob, JOB_QUEUED, JOB_RUNNING, JOB_DONE, JOB_FAILED
+from models.user import User
+from models.website import WebsiteCreate
+from controllers.recursive_crawler import RecursiveCrawlerController
+from controllers.logger import AppLogger
+from controllers.crawl_events import crawl_events
+
+
+class CrawlJobRunner:
+    """
+    Runs recursive crawls in background worker threads. Jobs live in the
+    crawljob table, so clients poll their status instead of holding a request
+    open for the whole crawl. Several API processes may share the table: each
+    job is claimed by one runner, which keeps a heartbeat on it while it runs.
+    """
+
+    def __init__(self, max_workers: int = CrawlerConfig.JOB_WORKERS, worker_id: Optional[str] = None):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="crawl-job")
+        # Same form as distributed crawl workers; a restarted container keeps its ID
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self._stopped = threading.Event()
+        self._heartbeat_thread: Optional[threading.Thread] = None
+
+    def submit(self, website_data: WebsiteCreate, session: Session, current_user: User) -> CrawlJob:
+        job = CrawlJob(
+            user_id=current_user.id,
+            base_url=website_data.base_url,
+            request_data=website_data.model_dump_json()
+        )
+        session.add(job)
+        session.commit()
+        session.refresh(job)
+
+        self.executor.submit(self._run, job.id)
+        return job
+
+    @staticmethod
+    def _progress_publisher(job_id: int, max_pages: int) -> Callable[[Dict], None]:
+        started = time.monotonic()
+        pages_crawled = 0
+
+        def on_page(page_data: Dict):
+            nonlocal pages_crawled
+            pages_crawled += 1
+            if not crawl_events.has_subscribers(job_id):
+                return
+
+            elapsed = time.monotonic() - started
+            crawl_events.publish(job_id, {
+                "type": "page",
+                "job_id": job_id,
+                "url": page_data["url"],
+                "status_code": page_data["status_code"],
+                "load_time": round(page_data["load_time"], 3),
+                "broken_links": len(page_data["broken_links"]),
+                "large_images": len(page_data["large_images"]),
+                "pages_crawled": pages_crawled,
+                "max_pages": max_pages,
+                "pages_per_sec": round(pages_crawled / elapsed, 2) if elapsed > 0 else 0
+            })
+
+        return on_page
+
+    def _claim(self, session: Session, job_id: int) -> bool:
+        """Move a queued job to running under this runner; False if another runner claimed it first"""
+        now = datetime.utcnow()
+        result = session.exec(
+            update(CrawlJob)
+            .where(CrawlJob.id == job_id, CrawlJob.status == JOB_QUEUED)
+            .values(status=JOB_RUNNING, worker_id=self.worker_id, started_at=now, heartbeat_at=now)
+        )
+        session.commit()
+        return result.rowcount == 1
+
+    def _run(self, job_id: int):
+        with Session(engine) as session:
+            if not self._claim(session, job_id):
+                return
+            job = session.get(CrawlJob, job_id)
+            user = session.get(User, job.user_id)
+            logger = AppLogger(session)
+
+            website_data = WebsiteCreate.model_validate_json(job.request_data)
+            try:
+                logger.log_analysis_start(job.base_url, user.id)
+                result = RecursiveCrawlerController.crawl_website_recursive(
+                    website_data, session, user,
+                    on_page=self._progress_publisher(job.id, website_data.max_pages)
+                )
+
+                job.status = JOB_DONE
+                job.website_id = result["id"]
+                job.page_count = result["page_count"]
+                job.metrics_data = json.dumps(result["metrics"])
+
+                logger.log_analysis_complete(job.base_url, user.id, {
+                    "total_pages": result["page_count"],
+                    "crawl_mode": "recursive",
+                    "max_pages": website_data.max_pages,
+                    "job_id": job.id
+                }, website_id=result["id"])
+            except Exception as e:
+                session.rollback()
+                job.status = JOB_FAILED
+                job.error = str(getattr(e, "detail", e))
+                logger.log_error("recursive_crawl_error", job.error, user.id, job.base_url)
+
+            job.finished_at = datetime.utcnow()
+            session.add(job)
+            session.commit()
+
+            crawl_events.publish(job.id, {
+                "type": job.status,
+                "job_id": job.id,
+                "website_id": job.website_id,
+                "page_count": job.page_count,
+                "error": job.error
+            })
+
+    def _fail_abandoned(self, session: Session, include_own: bool = False):
+        """
+        Fail running jobs whose runner is gone: heartbeat stale or missing, or, with
+        `include_own`, claimed under this runner's ID by a process that has since restarted.
+        Jobs other live runners are working on are left alone.
+        """
+        stale = datetime.utcnow() - timedelta(seconds=CrawlerConfig.JOB_STALE_SECONDS)
+        abandoned = [CrawlJob.heartbeat_at.is_(None), CrawlJob.heartbeat_at < stale]
+        if include_own:
+            abandoned.append(CrawlJob.worker_id == self.worker_id)
+
+        jobs = session.exec(select(CrawlJob).where(CrawlJob.status == JOB_RUNNING, or_(*abandoned))).all()
+        for job in jobs:
+            job.status = JOB_FAILED
+            job.error = ("Interrupted by server restart" if job.worker_id in (None, self.worker_id)
+                         else f"Interrupted: worker {job.worker_id} stopped responding")
+            job.finished_at = datetime.utcnow()
+            session.add(job)
+        session.commit()
+
+    def _heartbeat(self):
+        """Mark this runner's jobs alive, and fail jobs of runners that stopped doing so"""
+        while not self._stopped.wait(CrawlerConfig.JOB_HEARTBEAT_SECONDS):
+            try:
+                with Session(engine) as session:
+                    session.exec(
+                        update(CrawlJob)
+                        .where(CrawlJob.worker_id == self.worker_id, CrawlJob.status == JOB_RUNNING)
+                        .values(heartbeat_at=datetime.utcnow())
+                    )
+                    session.commit()
+                    self._fail_abandoned(session)
+            except Exception as e:
+                print(f"Crawl job heartbeat failed: {str(e)}")
+
+    def recover(self):
+        """
+        On startup: fail jobs a dead runner left running, resume queued ones (each
+        runs once however many processes resume it), and start the heartbeat.
+        """
+        with Session(engine) as session:
+            self._fail_abandoned(session, include_own=True)
+            queued = session.exec(select(CrawlJob.id).where(CrawlJob.status == JOB_QUEUED)).all()
+
+        for job_id in queued:
+            self.executor.submit(self._run, job_id)
+
+        if self._heartbeat_thread is None:
+            self._heartbeat_thread = threading.Thread(target=self._heartbeat, name="crawl-job-heartbeat", daemon=True)
+            self._heartbeat_thread.start()
+
+    def shutdown(self):
+        self._stopped.set()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def get_user_jobs(session: Session, current_user: User, limit: int = 50) -> List[CrawlJob]:
+        statement = select(CrawlJob).where(
+            CrawlJob.user_id == current_user.id
+        ).order_by(CrawlJob.created_at.desc()).limit(limit)
+        return session.exec(statement).all()
+
+
+crawl_job_runner = CrawlJobRunner()
@@ -0,0 +1,151 @@
+"""
+Crawl one site with several worker processes sharing a work queue.
+
+The coordinator creates the Website row, seeds a SQLiteWorkQueue with the base
+URL and sitemap URLs, and starts local workers. Each worker leases URLs, scrapes
+them with RecursiveCrawler.scrape_page, writes WebPage rows, pushes discovered
+links back (the queue dedupes them), and acks. Extra workers can join a running
+crawl with the `worker` command.
+
+SQLite WAL needs a local filesystem, so every worker must run on the machine that
+holds the queue and database files. Spreading across machines means swapping in a
+network-backed WorkQueue. Each worker paces hosts with its own HostScheduler, so a
+host sees up to one request per interval per worker.
+
+Run from backend/:
+    python -m controllers.distributed_crawler start https://example.com --max-pages 500 --workers 4
+    python -m controllers.distributed_crawler worker --crawl-id 12
+"""
+import argparse
+import multiprocessing
+import os
+import socket
+import time
+from typing import List, Optional
+from urllib.parse import urlparse
+from sqlmodel import Session
+from config.database import engine, create_db_and_tables
+from config.crawler_config import CrawlerConfig
+from models.website import Website
+from controllers.recursive_crawler import RecursiveCrawler, RecursiveCrawlerController
+from controllers.work_queue import SQLiteWorkQueue
+
+
+def run_worker(queue_path: str, crawl_id: int, worker_id: Optional[str] = None) -> int:
+    """Process URLs from the queue until the crawl is finished. Returns pages stored."""
+    worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+    queue = SQLiteWorkQueue(queue_path, crawl_id)
+    if queue.base_url is None:
+        raise ValueError(f"Crawl {crawl_id} not found in {queue_path}")
+
+    crawler = RecursiveCrawler()
+    crawler.domain = urlparse(queue.base_url).netloc
+    crawler.apply_robots_rules(queue.base_url)
+    stored = 0
+
+    try:
+        while True:
+            urls = queue.lease(worker_id)
+            if not urls:
+                if queue.is_finished():
+                    break
+                time.sleep(CrawlerConfig.QUEUE_POLL_SECONDS)
+                continue
+
+            url = urls[0]
+            try:
+                print(f"[{worker_id}] Crawling: {url}")
+                page_data = crawler.scrape_page(url)
+                with Session(engine) as session:
+                    session.add(RecursiveCrawlerController.build_webpage(page_data, crawl_id))
+                    session.commit()
+                queue.push(link for link in page_data['links'] if crawler.is_allowed(link))
+                queue.ack(url)
+                stored += 1
+            except Exception as e:
+                print(f"[{worker_id}] Failed on {url}: {str(e)}")
+                queue.release(url)
+    finally:
+        crawler.close()
+        queue.close()
+
+    print(f"[{worker_id}] Finished: {stored} pages stored")
+    return stored
+
+
+class DistributedCrawlCoordinator:
+    def __init__(self, queue_path: str = CrawlerConfig.WORK_QUEUE_PATH):
+        self.queue_path = queue_path
+
+    def start_crawl(self, base_url: str, max_pages: int, user_id: Optional[int] = None) -> int:
+        """Create the Website row and seed the shared queue. Returns the crawl id (= website id)."""
+        with Session(engine) as session:
+            website = Website(base_url=base_url, user_id=user_id)
+            session.add(website)
+            session.commit()
+            session.refresh(website)
+            crawl_id = website.id
+
+        seeder = RecursiveCrawler()
+        normalized_base = seeder._start_crawl(base_url, max_pages)
+        seed_urls = []
+        while seeder.to_visit:
+            seed_urls.append(seeder.to_visit.pop())
+
+        queue = SQLiteWorkQueue.create(self.queue_path, crawl_id, normalized_base, max_pages)
+        queue.push(seed_urls)
+        queue.close()
+
+        print(f"Crawl {crawl_id}: queued {len(seed_urls)} seed URLs in {self.queue_path}")
+        return crawl_id
+
+    def run_local_workers(self, crawl_id: int, workers: int) -> List[int]:
+        """Run `workers` worker processes on this machine and wait for the crawl to finish"""
+        context = multiprocessing.get_context("spawn")
+        processes = [
+            context.Process(target=run_worker, args=(self.queue_path, crawl_id, f"local-{index}"))
+            for index in range(workers)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        return [process.exitcode for process in processes]
+
+    def progress(self, crawl_id: int) -> dict:
+        queue = SQLiteWorkQueue(self.queue_path, crawl_id)
+        try:
+            return queue.counts()
+        finally:
+            queue.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Distributed crawl over a shared SQLite work queue")
+    parser.add_argument("--queue", default=CrawlerConfig.WORK_QUEUE_PATH, help="work queue database file")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    start = commands.add_parser("start", help="create a crawl and run local workers")
+    start.add_argument("base_url")
+    start.add_argument("--max-pages", type=int, default=50)
+    start.add_argument("--workers", type=int, default=4)
+    start.add_argument("--user-id", type=int)
+
+    worker = commands.add_parser("worker", help="join an existing crawl")
+    worker.add_argument("--crawl-id", type=int, required=True)
+    worker.add_argument("--worker-id")
+
+    args = parser.parse_args()
+    create_db_and_tables()
+    coordinator = DistributedCrawlCoordinator(args.queue)
+
+    if args.command == "start":
+        crawl_id = coordinator.start_crawl(args.base_url, args.max_pages, args.user_id)
+        coordinator.run_local_workers(crawl_id, args.workers)
+        print(f"Crawl {crawl_id} finished: {coordinator.progress(crawl_id)}")
+    else:
+        run_worker(args.queue, args.crawl_id, args.worker_id)
+
+
+if __name__ == "__main__":
+    main()
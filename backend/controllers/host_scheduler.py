@@ -0,0 +1,42 @@
+import threading
+import time
+from typing import Dict
+from urllib.parse import urlparse
+
+
+class HostScheduler:
+    """
+    Per-host politeness: requests to one host are spaced at least
+    `min_interval` seconds apart, requests to different hosts never wait on each other.
+    Safe to share between threads.
+    """
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self.host_intervals: Dict[str, float] = {}
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def set_host_interval(self, host: str, interval: float):
+        with self._lock:
+            self.host_intervals[host] = interval
+
+    def _reserve(self, url: str) -> float:
+        """Book the next free slot for the URL's host and return how long to wait for it"""
+        host = urlparse(url).netloc
+        with self._lock:
+            interval = self.host_intervals.get(host, self.min_interval)
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + interval
+        return slot - now
+
+    def wait(self, url: str):
+        delay = self._reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+
+    def reset(self):
+        with self._lock:
+            self.host_intervals.clear()
+            self._next_slot.clear()
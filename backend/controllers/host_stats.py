@@ -0,0 +1,174 @@
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+from urllib.parse import urlparse
+import requests
+from config.crawler_config import CrawlerConfig
+from controllers.http_client import HttpClient
+from controllers.resilience import CircuitBreaker, RetryPolicy
+
+
+class HostLatency:
+    __slots__ = ('requests', 'failures', 'retries', 'ewma', 'samples', 'total_time')
+
+    def __init__(self, window: int):
+        self.requests = 0
+        self.failures = 0
+        self.retries = 0
+        self.ewma: Optional[float] = None
+        self.samples: Deque[float] = deque(maxlen=window)
+        self.total_time = 0.0
+
+    def p95(self) -> Optional[float]:
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[int(0.95 * (len(ordered) - 1))]
+
+
+class HostStats:
+    """
+    Per-host response times for one crawl: an EWMA and a p95 over the last
+    `window` responses. Once a host has enough samples its read timeout is
+    ADAPTIVE_TIMEOUT_MULTIPLIER x p95 (never below the floor, never above the
+    caller's timeout), so a slow third-party host costs seconds, not the full
+    timeout, per link.
+    """
+
+    def __init__(self, alpha: float = CrawlerConfig.HOST_STATS_ALPHA,
+                 window: int = CrawlerConfig.HOST_STATS_WINDOW):
+        self.alpha = alpha
+        self.window = window
+        self._hosts: Dict[str, HostLatency] = {}
+        self._lock = threading.Lock()
+
+    def _host(self, host: str) -> HostLatency:
+        stats = self._hosts.get(host)
+        if stats is None:
+            stats = self._hosts[host] = HostLatency(self.window)
+        return stats
+
+    def record(self, url: str, elapsed: float, ok: bool):
+        with self._lock:
+            stats = self._host(urlparse(url).netloc)
+            stats.requests += 1
+            stats.total_time += elapsed
+            if ok:
+                stats.samples.append(elapsed)
+                stats.ewma = elapsed if stats.ewma is None else self.alpha * elapsed + (1 - self.alpha) * stats.ewma
+            else:
+                stats.failures += 1
+
+    def record_retry(self, url: str):
+        with self._lock:
+            self._host(urlparse(url).netloc).retries += 1
+
+    def timeout_for(self, url: str, default: Optional[float], adaptive: bool = True) -> Tuple[float, float]:
+        """
+        (connect, read) timeout for the next request to the URL's host. With
+        adaptive=False the read timeout stays the caller's: page fetches, whose
+        slowness is what the audit reports, are not cut short by fast link checks.
+        """
+        default = default or CrawlerConfig.DEFAULT_TIMEOUT_SECONDS
+        connect = min(CrawlerConfig.CONNECT_TIMEOUT_SECONDS, default)
+        if not adaptive:
+            return connect, default
+
+        with self._lock:
+            stats = self._hosts.get(urlparse(url).netloc)
+            if stats is None or len(stats.samples) < CrawlerConfig.ADAPTIVE_TIMEOUT_MIN_SAMPLES:
+                return connect, default
+            p95 = stats.p95()
+
+        read = p95 * CrawlerConfig.ADAPTIVE_TIMEOUT_MULTIPLIER
+        return connect, min(default, max(CrawlerConfig.ADAPTIVE_TIMEOUT_FLOOR_SECONDS, read))
+
+    def reset(self):
+        with self._lock:
+            self._hosts.clear()
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Per-host stats, the hosts that cost the crawl the most time first"""
+        with self._lock:
+            hosts = sorted(self._hosts.items(), key=lambda item: item[1].total_time, reverse=True)
+            result = {}
+            for host, stats in hosts:
+                p95 = stats.p95()
+                result[host] = {
+                    'requests': stats.requests,
+                    'failures': stats.failures,
+                    'retries': stats.retries,
+                    'ewma_ms': round(stats.ewma * 1000, 1) if stats.ewma is not None else None,
+                    'p95_ms': round(p95 * 1000, 1) if p95 is not None else None,
+                    'total_time_s': round(stats.total_time, 3)
+                }
+            return result
+
+
+class TrackedClient:
+    """
+    HttpClient wrapper for one crawl: applies the host's adaptive timeout,
+    records every response time in HostStats (pass adaptive_timeout=False to
+    keep the caller's read timeout), retries transient failures of
+    idempotent requests per the RetryPolicy, and refuses requests to hosts whose
+    circuit is open (CircuitOpenError). Same get/head/request interface as HttpClient.
+    """
+
+    def __init__(self, client: HttpClient, host_stats: HostStats,
+                 breaker: Optional[CircuitBreaker] = None, retry_policy: Optional[RetryPolicy] = None):
+        self.client = client
+        self.host_stats = host_stats
+        self.breaker = breaker or CircuitBreaker()
+        self.retry_policy = retry_policy or RetryPolicy()
+
+    def _send(self, method: str, url: str, timeout, adaptive_timeout: bool, **kwargs) -> requests.Response:
+        timeout = self.host_stats.timeout_for(url, timeout, adaptive_timeout)
+        start = time.monotonic()
+        try:
+            response = self.client.request(method, url, timeout=timeout, **kwargs)
+        except requests.exceptions.RequestException:
+            self.host_stats.record(url, time.monotonic() - start, ok=False)
+            raise
+
+        self.host_stats.record(url, time.monotonic() - start, ok=response.status_code < 500)
+        return response
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """One logical request: the breaker is asked once and told the final outcome, however many attempts it took"""
+        timeout = kwargs.pop('timeout', None)
+        adaptive_timeout = kwargs.pop('adaptive_timeout', True)
+        self.breaker.before_request(url)
+        attempt = 1
+        while True:
+            try:
+                response = self._send(method, url, timeout, adaptive_timeout, **kwargs)
+            except requests.exceptions.RequestException as e:
+                if not self.retry_policy.should_retry(method, attempt, error=e):
+                    self.breaker.record_failure(url)
+                    raise
+                delay = self.retry_policy.delay(attempt)
+            else:
+                if not self.retry_policy.should_retry(method, attempt, response=response):
+                    if response.status_code < 500:
+                        self.breaker.record_success(url)
+                    else:
+                        self.breaker.record_failure(url)
+                    return response
+                delay = self.retry_policy.delay(attempt, response)
+                response.close()
+
+            self.host_stats.record_retry(url)
+            time.sleep(delay)
+            attempt += 1
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault('allow_redirects', True)
+        return self.request('GET', url, **kwargs)
+
+    def head(self, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault('allow_redirects', False)
+        return self.request('HEAD', url, **kwargs)
+
+    def stats(self) -> Dict:
+        return self.client.stats()
@@ -0,0 +1,107 @@
+import threading
+from http.cookiejar import DefaultCookiePolicy
+import requests
+from typing import Dict
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from config.crawler_config import CrawlerConfig
+
+def _counting_pool(base_pool, client: "HttpClient"):
+    """Connection pool class that reports every TCP/TLS connect (new or re-opened) to the client"""
+    class CountingConnection(base_pool.ConnectionCls):
+        def connect(self):
+            client._record_connection()
+            super().connect()
+
+    class CountingPool(base_pool):
+        ConnectionCls = CountingConnection
+
+    return CountingPool
+
+
+class _PooledAdapter(HTTPAdapter):
+    def __init__(self, client: "HttpClient", **kwargs):
+        self.client = client
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _counting_pool(HTTPConnectionPool, self.client),
+            'https': _counting_pool(HTTPSConnectionPool, self.client),
+        }
+
+    def send(self, request, **kwargs):
+        # Counted here rather than in HttpClient.request so redirect hops are included
+        self.client._record_request()
+        return super().send(request, **kwargs)
+
+
+class HttpClient:
+    """
+    Shared HTTP client for all outbound fetches: one requests.Session with
+    per-host keep-alive connection pools, so repeated requests to a host reuse
+    an open connection instead of paying a new TCP + TLS handshake.
+    Cookies are not persisted between requests.
+    Thread-safe for the crawler's worker threads.
+    """
+
+    def __init__(self, pool_connections: int = CrawlerConfig.HTTP_POOL_CONNECTIONS,
+                 pool_maxsize: int = CrawlerConfig.HTTP_POOL_MAXSIZE):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self._lock = threading.Lock()
+        self.requests_sent = 0
+        self.connections_opened = 0
+        self.session = self._build_session()
+
+    def _build_session(self) -> requests.Session:
+        session = requests.Session()
+        # The session is shared by every crawl in the process: never keep cookies, or one
+        # site's session cookies would be sent on another user's crawl of it
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        adapter = _PooledAdapter(self, pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def _record_connection(self):
+        with self._lock:
+            self.connections_opened += 1
+
+    def _record_request(self):
+        with self._lock:
+            self.requests_sent += 1
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault('allow_redirects', True)
+        return self.request('GET', url, **kwargs)
+
+    def head(self, url: str, **kwargs) -> requests.Response:
+        # Same default as requests.head
+        kwargs.setdefault('allow_redirects', False)
+        return self.request('HEAD', url, **kwargs)
+
+    def close(self):
+        self.session.close()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            requests_sent = self.requests_sent
+            connections_opened = self.connections_opened
+
+        reused = max(requests_sent - connections_opened, 0)
+        return {
+            'requests': requests_sent,
+            'connections_opened': connections_opened,
+            'connections_reused': reused,
+            'reuse_ratio': round(reused / requests_sent, 4) if requests_sent else 0,
+            'pool_connections': self.pool_connections,
+            'pool_maxsize': self.pool_maxsize
+        }
+
+
+http_client = HttpClient()
@@ -1,41 +1,50 @@
 import requests
-from typing import List, Dict
+from typing import List, Dict, Optional
 from urllib.parse import urljoin
 from fastapi import HTTPException
+from controllers.http_client import HttpClient, http_client
+from controllers.image_metadata_cache import ImageMetadataCache
 
 class ImageAnalyzer:
     @staticmethod
-    def analyze_single_image(image_url: str, base_url: str = "") -> Dict:
+    def analyze_single_image(image_url: str, base_url: str = "", client: Optional[HttpClient] = None,
+                             image_cache: Optional[ImageMetadataCache] = None) -> Dict:
+        """Sizes the server leaves out of its HEAD response come from stored metadata (same URL + ETag) before probing"""
         try:
             if not image_url.startswith(('http://', 'https://')):
                 image_url = urljoin(base_url, image_url)
             
-            response = requests.head(image_url, timeout=10)
+            image_cache = image_cache or ImageMetadataCache()
+            metadata = image_cache.head(
+                image_url, lambda: image_cache.fetch(image_url, {}, client or http_client, timeout=10)
+            )
             
             analysis = {
                 "url": image_url,
-                "accessible": response.status_code == 200,
-                "status_code": response.status_code,
-                "content_type": response.headers.get('content-type', ''),
+                "accessible": metadata['status_code'] == 200,
+                "status_code": metadata['status_code'],
+                "content_type": metadata['content_type'],
                 "issues": []
             }
             
-            if response.status_code == 200:
-                content_length = response.headers.get('content-length')
+            if metadata['status_code'] == 200:
+                content_length = metadata['content_length']
                 if content_length:
-                    file_size_kb = int(content_length) / 1024
+                    file_size_kb = content_length / 1024
                     analysis["file_size_kb"] = round(file_size_kb, 2)
+                    if not metadata['size_exact']:
+                        analysis["file_size_at_least"] = True
                     
                     if file_size_kb > 500:
                         analysis["issues"].append(f"Large file size: {file_size_kb:.1f}KB")
                 
-                content_type = response.headers.get('content-type', '').lower()
+                content_type = metadata['content_type'].lower()
                 if 'image/' not in content_type:
                     analysis["issues"].append("Not an image file")
                     analysis["accessible"] = False
             
             else:
-                analysis["issues"].append(f"HTTP Error: {response.status_code}")
+                analysis["issues"].append(f"HTTP Error: {metadata['status_code']}")
             
             return analysis
             
@@ -47,12 +56,15 @@ class ImageAnalyzer:
             }
 
     @staticmethod
-    def analyze_multiple_images(image_urls: List[str], base_url: str = "") -> Dict:
+    def analyze_multiple_images(image_urls: List[str], base_url: str = "", client: Optional[HttpClient] = None,
+                                image_cache: Optional[ImageMetadataCache] = None) -> Dict:
+        """Pass a crawler's image_cache to reuse what the crawl already fetched; repeated URLs are requested once either way"""
+        image_cache = image_cache or ImageMetadataCache()
         results = []
         problematic_images = []
         
         for image_url in image_urls:
-            result = ImageAnalyzer.analyze_single_image(image_url, base_url)
+            result = ImageAnalyzer.analyze_single_image(image_url, base_url, client, image_cache)
             results.append(result)
             
             if result["issues"] or not result["accessible"]:
@@ -0,0 +1,163 @@
+import threading
+from datetime import datetime
+from typing import Callable, Dict, Optional
+from sqlmodel import Session
+from config.database import engine
+from config.crawler_config import CrawlerConfig
+from models.image_metadata import ImageMetadata
+from controllers.crawl_cache import CoalescingCache
+from controllers.http_client import HttpClient
+from controllers.host_scheduler import HostScheduler
+from controllers import resource_probe
+
+
+class ImageMetadataCache:
+    """
+    What we learned about each image URL during a crawl: the HEAD result
+    (status, content-length, content-type, ETag) and the dimension check, so a
+    logo or banner shared by every page is requested once per crawl.
+    With `persist`, size, type and dimensions are also stored by URL + ETag and
+    reused by later crawls and image checks while the server still reports the same ETag.
+    """
+
+    def __init__(self, persist: bool = CrawlerConfig.IMAGE_METADATA_PERSIST):
+        self.persist = persist
+        self._heads = CoalescingCache()
+        self._dimensions = CoalescingCache()
+        self._lock = threading.Lock()
+        self.stored_sizes = 0
+        self.stored_dimensions = 0
+
+    @staticmethod
+    def from_response(response) -> Dict:
+        content_length = response.headers.get('content-length')
+        if response.status_code == 206:
+            # Ranged GET standing in for a rejected HEAD
+            return {
+                'status_code': 200,
+                'content_length': resource_probe.content_range_total(response),
+                'content_type': response.headers.get('content-type', ''),
+                'etag': response.headers.get('etag'),
+                'size_exact': True
+            }
+        return {
+            'status_code': response.status_code,
+            'content_length': int(content_length) if content_length else None,
+            'content_type': response.headers.get('content-type', ''),
+            'etag': response.headers.get('etag'),
+            'size_exact': True
+        }
+
+    def fetch(self, url: str, headers: dict, client: HttpClient, timeout: float,
+              scheduler: Optional[HostScheduler] = None) -> Dict:
+        """
+        HEAD metadata for an image (ranged GET if HEAD is rejected). When the
+        server sends no Content-Length, the size stored for the same URL + ETag is
+        used, else the size is probed; size_exact=False means the body was longer
+        than SIZE_PROBE_MAX_BYTES and content_length is a lower bound.
+        A scheduler paces every request sent.
+        """
+        metadata = self.from_response(resource_probe.head(client, url, headers, timeout, scheduler=scheduler))
+        if metadata['status_code'] != 200 or metadata['content_length'] is not None:
+            return metadata
+
+        stored = self._load(url, metadata['etag']) if self.persist and metadata['etag'] else None
+        if stored and stored['content_length'] is not None:
+            metadata['content_length'] = stored['content_length']
+            metadata['content_type'] = metadata['content_type'] or stored['content_type'] or ''
+            with self._lock:
+                self.stored_sizes += 1
+            return metadata
+
+        probed = resource_probe.probe_size(client, url, headers, timeout, scheduler=scheduler)
+        if probed:
+            metadata['content_length'], metadata['size_exact'] = probed
+        return metadata
+
+    def head(self, url: str, fetch: Callable[[], Dict]) -> Dict:
+        """HEAD metadata for the image, fetched at most once per crawl (fetch returns from_response(...))"""
+        return self._heads.get_or_compute(url, fetch)
+
+    def dimensions(self, url: str, metadata: Dict, compute: Callable[[], Dict]) -> Dict:
+        """Dimension check for the image, from this crawl, the persistent store, or `compute` (whose errors are not kept)"""
+        return self._dimensions.get_or_compute(url, lambda: self._load_or_compute(url, metadata, compute))
+
+    def _load_or_compute(self, url: str, metadata: Dict, compute: Callable[[], Dict]) -> Dict:
+        etag = metadata.get('etag')
+        if not (self.persist and etag):
+            return compute()
+
+        stored = self._load(url, etag)
+        if stored:
+            with self._lock:
+                self.stored_dimensions += 1
+            return {key: stored[key] for key in ('is_banner', 'width', 'height', 'aspect_ratio')}
+
+        result = compute()
+        if result['width'] > 0:
+            self._save(url, metadata, result)
+        return result
+
+    @staticmethod
+    def _load(url: str, etag: str) -> Optional[Dict]:
+        """The stored record for the URL, if it was stored under this ETag"""
+        try:
+            with Session(engine) as session:
+                entry = session.get(ImageMetadata, url)
+        except Exception as e:
+            print(f"Image metadata lookup failed for {url}: {str(e)}")
+            return None
+
+        if entry is None or entry.etag != etag:
+            return None
+        return {
+            'content_length': entry.content_length,
+            'content_type': entry.content_type,
+            'is_banner': entry.is_banner,
+            'width': entry.width,
+            'height': entry.height,
+            'aspect_ratio': entry.aspect_ratio
+        }
+
+    @staticmethod
+    def _save(url: str, metadata: Dict, result: Dict):
+        try:
+            with Session(engine) as session:
+                session.merge(ImageMetadata(
+                    url=url,
+                    etag=metadata['etag'],
+                    # A probed lower bound is not worth keeping
+                    content_length=metadata.get('content_length') if metadata.get('size_exact', True) else None,
+                    content_type=metadata.get('content_type'),
+                    width=result['width'],
+                    height=result['height'],
+                    aspect_ratio=result['aspect_ratio'],
+                    is_banner=result['is_banner'],
+                    checked_at=datetime.utcnow()
+                ))
+                session.commit()
+        except Exception as e:
+            print(f"Image metadata save failed for {url}: {str(e)}")
+
+    def clear(self):
+        self._heads.clear()
+        self._dimensions.clear()
+        with self._lock:
+            self.stored_sizes = 0
+            self.stored_dimensions = 0
+
+    def stats(self) -> Dict:
+        heads = self._heads.stats()
+        dimensions = self._dimensions.stats()
+        with self._lock:
+            stored_sizes = self.stored_sizes
+            stored_dimensions = self.stored_dimensions
+        return {
+            'images': heads['entries'],
+            'head_requests': heads['misses'],
+            'head_reused': heads['hits'] + heads['coalesced'],
+            'size_from_store': stored_sizes,
+            'dimension_checks': dimensions['misses'] - stored_dimensions,
+            'dimension_reused': dimensions['hits'] + dimensions['coalesced'],
+            'dimension_from_store': stored_dimensions
+        }
@@ -0,0 +1,84 @@
+from io import BytesIO
+from typing import Optional, Tuple
+from PIL import Image
+from config.crawler_config import CrawlerConfig
+from controllers.http_client import HttpClient, http_client
+from controllers.host_scheduler import HostScheduler
+from controllers.resource_probe import content_range_total, pace
+
+
+def webp_size(data: bytes) -> Optional[Tuple[int, int]]:
+    """
+    (width, height) from the first 30 bytes of a WebP file. Pillow's WebP
+    plugin decodes the whole file even to report the size, so the header is read here.
+    """
+    if len(data) < 30 or data[:4] != b'RIFF' or data[8:12] != b'WEBP':
+        return None
+    chunk = data[12:16]
+    if chunk == b'VP8 ':
+        return (int.from_bytes(data[26:28], 'little') & 0x3fff,
+                int.from_bytes(data[28:30], 'little') & 0x3fff)
+    if chunk == b'VP8L':
+        bits = int.from_bytes(data[21:25], 'little')
+        return (bits & 0x3fff) + 1, ((bits >> 14) & 0x3fff) + 1
+    if chunk == b'VP8X':
+        return int.from_bytes(data[24:27], 'little') + 1, int.from_bytes(data[27:30], 'little') + 1
+    return None
+
+
+def _read_header(response, data: bytearray, max_bytes: int) -> Optional[Tuple[int, int]]:
+    """Append the body to `data` chunk by chunk until Pillow can read the image header"""
+    for chunk in response.iter_content(chunk_size=4096):
+        data += chunk
+        if data[:4] == b'RIFF':
+            size = webp_size(data)
+            if size or len(data) >= 30:
+                return size
+            continue
+        try:
+            # Image.open only parses the header; pixel data is never decoded
+            return Image.open(BytesIO(data)).size
+        except Exception:
+            if len(data) >= max_bytes:
+                return None
+    return None
+
+
+def probe_image_dimensions(img_url: str, headers: dict, client: Optional[HttpClient] = None,
+                           max_bytes: int = CrawlerConfig.IMAGE_PROBE_MAX_BYTES,
+                           scheduler: Optional[HostScheduler] = None) -> Optional[Tuple[int, int]]:
+    """
+    (width, height) of a remote image, reading only as much of it as the header needs.
+    Asks for the first IMAGE_PROBE_BYTES with a Range request (JPEG/PNG/GIF/WebP
+    headers nearly always fit), then for more up to `max_bytes` if needed. Servers
+    that ignore Range are read as a stream and cut off once the header is parsed.
+    Returns None if the size could not be found within `max_bytes`.
+    With a scheduler, each request waits for the host's slot.
+    """
+    client = client or http_client
+    data = bytearray()
+
+    first_range = dict(headers, Range=f"bytes=0-{min(CrawlerConfig.IMAGE_PROBE_BYTES, max_bytes) - 1}")
+    pace(scheduler, img_url)
+    with client.get(img_url, headers=first_range, timeout=5, stream=True) as response:
+        response.raise_for_status()
+        size = _read_header(response, data, max_bytes)
+        if response.status_code != 206:
+            return size
+        # Finish the small ranged body so the connection goes back to the pool
+        response.raw.read()
+        if size:
+            return size
+        total = content_range_total(response)
+
+    if len(data) >= max_bytes or (total is not None and len(data) >= total):
+        return None
+
+    # Header runs past the first range (e.g. a JPEG with large EXIF/ICC blocks)
+    next_range = dict(headers, Range=f"bytes={len(data)}-{max_bytes - 1}")
+    pace(scheduler, img_url)
+    with client.get(img_url, headers=next_range, timeout=5, stream=True) as response:
+        response.raise_for_status()
+        if response.status_code != 206:
+            data.clear()
+        return _read_header(response, data, max_bytes)
@@ -2,17 +2,42 @@ import requests
 from typing import List, Dict
 from urllib.parse import urljoin
 from fastapi import HTTPException
+from controllers.link_status_store import link_status_store
+from controllers.http_client import HttpClient, http_client
+from controllers import resource_probe
 
 class LinkChecker:
     @staticmethod
-    def check_single_link(url: str, base_url: str = "") -> Dict:
+    def _result_from_store(url: str, stored: Dict) -> Dict:
+        if stored["status_code"] == 0:
+            return {
+                "url": url,
+                "status_code": 0,
+                "working": False,
+                "error": stored.get("error", "")
+            }
+        
+        return {
+            "url": url,
+            "status_code": stored["status_code"],
+            "working": stored["status_code"] < 400,
+            "final_url": stored["final_url"] or url,
+            "redirected": stored["redirected"]
+        }
+
+    @staticmethod
+    def check_single_link(url: str, base_url: str = "", client: HttpClient = None) -> Dict:
+        if not url.startswith(('http://', 'https://')):
+            url = urljoin(base_url, url)
+        
+        stored = link_status_store.get(url)
+        if stored:
+            return LinkChecker._result_from_store(url, stored)
+        
         try:
-            if not url.startswith(('http://', 'https://')):
-                url = urljoin(base_url, url)
-            
-            response = requests.head(url, timeout=10, allow_redirects=True)
+            response = resource_probe.head(client or http_client, url, {}, timeout=10, allow_redirects=True)
             
-            return {
+            result = {
                 "url": url,
                 "status_code": response.status_code,
                 "working": response.status_code < 400,
@@ -21,20 +46,23 @@ class LinkChecker:
             }
             
         except requests.exceptions.RequestException as e:
-            return {
+            result = {
                 "url": url,
                 "status_code": 0,
                 "working": False,
                 "error": str(e)
             }
+        
+        link_status_store.save(url, result)
+        return result
 
     @staticmethod
-    def check_multiple_links(links: List[str], base_url: str = "") -> Dict:
+    def check_multiple_links(links: List[str], base_url: str = "", client: HttpClient = None) -> Dict:
         results = []
         broken_links = []
         
         for link in links:
-            result = LinkChecker.check_single_link(link, base_url)
+            result = LinkChecker.check_single_link(link, base_url, client)
             results.append(result)
             
             if not result["working"]:
@@ -46,4 +74,4 @@ class LinkChecker:
             "working_links": [r for r in results if r["working"]],
             "broken_count": len(broken_links),
             "health_score": round((len(links) - len(broken_links)) / len(links) * 100, 2) if links else 0
-        }
\ No newline at end of file
+        }
@@ -0,0 +1,100 @@
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+from sqlmodel import Session, select, func
+from config.database import engine
+from config.crawler_config import CrawlerConfig
+from models.link_status import LinkStatus, LinkStatusCacheStats
+from controllers.url_normalizer import normalize_url
+
+
+class LinkStatusStore:
+    """
+    Link check results persisted across crawls, keyed by normalized URL.
+    Working links are trusted for `ttl_seconds`, broken or unreachable ones
+    for the shorter `negative_ttl_seconds` so fixes show up quickly.
+    """
+
+    def __init__(self, ttl_seconds: int = CrawlerConfig.LINK_STATUS_TTL_SECONDS,
+                 negative_ttl_seconds: int = CrawlerConfig.LINK_STATUS_NEGATIVE_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.writes = 0
+
+    @staticmethod
+    def is_negative(status_code: int) -> bool:
+        return status_code == 0 or status_code >= 400
+
+    def _is_fresh(self, entry: LinkStatus) -> bool:
+        ttl = self.negative_ttl_seconds if self.is_negative(entry.status_code) else self.ttl_seconds
+        return datetime.utcnow() - entry.checked_at < timedelta(seconds=ttl)
+
+    def get(self, url: str) -> Optional[Dict]:
+        """Stored result for the URL, or None if it was never checked or has expired"""
+        try:
+            with Session(engine) as session:
+                entry = session.get(LinkStatus, normalize_url(url))
+        except Exception as e:
+            print(f"Link status lookup failed for {url}: {str(e)}")
+            entry = None
+
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            if not self._is_fresh(entry):
+                self.misses += 1
+                self.expired += 1
+                return None
+            self.hits += 1
+
+        result = {
+            'status_code': entry.status_code,
+            'final_url': entry.final_url,
+            'redirected': entry.redirected,
+            'checked_at': entry.checked_at.isoformat()
+        }
+        if entry.error:
+            result['error'] = entry.error
+        return result
+
+    def save(self, url: str, result: Dict):
+        try:
+            with Session(engine) as session:
+                session.merge(LinkStatus(
+                    url=normalize_url(url),
+                    status_code=result['status_code'],
+                    final_url=result.get('final_url'),
+                    redirected=result.get('redirected', False),
+                    error=result.get('error'),
+                    checked_at=datetime.utcnow()
+                ))
+                session.commit()
+            with self._lock:
+                self.writes += 1
+        except Exception as e:
+            print(f"Link status save failed for {url}: {str(e)}")
+
+    def stats(self) -> LinkStatusCacheStats:
+        with Session(engine) as session:
+            entries = session.exec(select(func.count()).select_from(LinkStatus)).one()
+
+        with self._lock:
+            lookups = self.hits + self.misses
+            return LinkStatusCacheStats(
+                entries=entries,
+                hits=self.hits,
+                misses=self.misses,
+                expired=self.expired,
+                writes=self.writes,
+                hit_rate=round(self.hits / lookups * 100, 2) if lookups else 0,
+                ttl_seconds=self.ttl_seconds,
+                negative_ttl_seconds=self.negative_ttl_seconds
+            )
+
+
+link_status_store = LinkStatusStore()
@@ -0,0 +1,170 @@
+import importlib.util
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from bs4 import BeautifulSoup
+from config.crawler_config import CrawlerConfig
+
+MAX_CONTENT_LENGTH = 10000
+# Everything str.splitlines() treats as the end of a line
+LINE_BREAKS = '\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029'
+
+# Tags whose text is page chrome rather than content
+STRIPPED_TAGS = ["script", "style", "nav", "header", "footer", "aside"]
+
+# Preference order for HTML_PARSER=auto, fastest first
+PARSER_BACKENDS = ["selectolax", "lxml", "html.parser"]
+_BACKEND_MODULES = {"selectolax": "selectolax.lexbor", "lxml": "lxml", "html.parser": None}
+
+
+class PageFacts:
+    """
+    Everything the crawler needs from one HTML page, pulled out in a single parse.
+    anchors: (href, link text) per <a href>, in document order
+    images: {'src', 'class', 'alt'} per <img src>; 'class'/'alt' only when the tag has them
+    """
+    __slots__ = ('title', 'content', 'anchors', 'images')
+
+    def __init__(self, title: Optional[str], content: str,
+                 anchors: List[Tuple[str, str]], images: List[Dict]):
+        self.title = title
+        self.content = content
+        self.anchors = anchors
+        self.images = images
+
+
+def is_backend_available(backend: str) -> bool:
+    module = _BACKEND_MODULES.get(backend)
+    if module is None:
+        return True
+    try:
+        return importlib.util.find_spec(module) is not None
+    except ImportError:
+        return False
+
+
+def resolve_parser_backend(backend: Optional[str] = None) -> str:
+    """
+    Pick the parser to use: an explicit name, else CrawlerConfig.HTML_PARSER.
+    'auto' (or an unavailable backend) falls back to the fastest installed one.
+    """
+    backend = backend or CrawlerConfig.HTML_PARSER
+
+    if backend != "auto":
+        if backend not in _BACKEND_MODULES:
+            raise ValueError(f"Unknown HTML parser backend: {backend}")
+        if is_backend_available(backend):
+            return backend
+        print(f"HTML parser backend '{backend}' is not installed, falling back")
+
+    return next(name for name in PARSER_BACKENDS if is_backend_available(name))
+
+
+def _iter_lines(pieces: Iterable[str]) -> Iterator[str]:
+    """Lines of the concatenated pieces (text nodes), produced as the pieces are read"""
+    partial = ''
+    for piece in pieces:
+        lines = (partial + piece).splitlines()
+        partial = ''
+        if lines and not piece.endswith(tuple(LINE_BREAKS)):
+            partial = lines.pop()
+        yield from lines
+    if partial:
+        yield partial
+
+
+def collapse_text(text_content: Union[str, Iterable[str]], max_length: int = MAX_CONTENT_LENGTH) -> str:
+    """
+    Whitespace-collapsed text, cut at max_length. Accepts the text or its pieces
+    in document order; pieces stop being read once max_length is passed.
+    """
+    pieces = [text_content] if isinstance(text_content, str) else text_content
+    chunks = []
+    length = -1
+    for line in _iter_lines(pieces):
+        for phrase in line.strip().split("  "):
+            phrase = phrase.strip()
+            if phrase:
+                chunks.append(phrase)
+                length += len(phrase) + 1
+        if length > max_length:
+            break
+    clean_content = ' '.join(chunks)
+
+    if len(clean_content) > max_length:
+        clean_content = clean_content[:max_length] + "... [content truncated]"
+
+    return clean_content
+
+
+def clean_text(soup: BeautifulSoup, max_length: int = MAX_CONTENT_LENGTH) -> str:
+    """Drop page chrome from the tree and collapse the remaining text"""
+    for element in soup(STRIPPED_TAGS):
+        element.decompose()
+
+    return collapse_text(soup.strings, max_length)
+
+
+def _extract_with_soup(html_content, features: str, max_content_length: int) -> PageFacts:
+    soup = BeautifulSoup(html_content, features)
+
+    title = soup.title.string if soup.title else "No title found"
+    if title is not None:
+        title = str(title)
+
+    # Links and images first: clean_text removes nav/header/footer from the tree
+    anchors = [
+        (link['href'], link.get_text(strip=True)[:100])
+        for link in soup.find_all('a', href=True)
+    ]
+
+    images = []
+    for img in soup.find_all('img', src=True):
+        image = {'src': img['src']}
+        if img.get('class'):
+            image['class'] = img['class']
+        if img.get('alt') is not None:
+            image['alt'] = img['alt']
+        images.append(image)
+
+    return PageFacts(title, clean_text(soup, max_content_length), anchors, images)
+
+
+def _extract_with_selectolax(html_content, max_content_length: int) -> PageFacts:
+    from selectolax.lexbor import LexborHTMLParser
+
+    tree = LexborHTMLParser(html_content)
+
+    title_node = tree.css_first('title')
+    title = title_node.text() if title_node else "No title found"
+
+    anchors = [
+        (node.attributes.get('href') or '', node.text(strip=True)[:100])
+        for node in tree.css('a[href]')
+    ]
+
+    images = []
+    for node in tree.css('img[src]'):
+        attributes = node.attributes
+        image = {'src': attributes.get('src') or ''}
+        if attributes.get('class'):
+            image['class'] = attributes['class'].split()
+        if 'alt' in attributes:
+            image['alt'] = attributes['alt'] or ''
+        images.append(image)
+
+    tree.strip_tags(STRIPPED_TAGS)
+    text_nodes = (
+        node.text_content or ''
+        for node in (tree.root.traverse(include_text=True) if tree.root else ())
+        if node.tag == '-text'
+    )
+
+    return PageFacts(title, collapse_text(text_nodes, max_content_length), anchors, images)
+
+
+def extract_page_facts(html_content, backend: Optional[str] = None,
+                       max_content_length: int = MAX_CONTENT_LENGTH) -> PageFacts:
+    backend = backend or resolve_parser_backend()
+
+    if backend == "selectolax":
+        return _extract_with_selectolax(html_content, max_content_length)
+    return _extract_with_soup(html_content, backend, max_content_length)
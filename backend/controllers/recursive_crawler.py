@@ -1,23 +1,73 @@
 from sqlmodel import Session, select
 from fastapi import HTTPException
-from typing import List, Set, Dict, Optional
+from typing import List, Set, Dict, Optional, Tuple, Callable
 import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin, urlparse, urldefrag
 import time
+import asyncio
+import hashlib
+import json
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from models.website import Website, WebPage, WebsiteCreate, WebPageRead
 from models.user import User
 from controllers.sitemap_parser import SitemapParser
+from controllers.host_scheduler import HostScheduler
+from controllers.robots_cache import RobotsCache, robots_cache
+from controllers.crawl_frontier import CrawlFrontier
+from controllers.seen_set import CompactSeenSet
+from controllers.crawl_cache import CoalescingCache
+from controllers.url_normalizer import normalize_url, normalize_links
+from controllers.link_status_store import link_status_store
+from controllers.http_client import HttpClient, http_client
+from controllers.host_stats import HostStats, TrackedClient
+from controllers.resilience import CircuitBreaker, CircuitOpenError
+from controllers.image_probe import probe_image_dimensions
+from controllers import resource_probe
+from controllers.image_metadata_cache import ImageMetadataCache
+from controllers.page_facts import PageFacts, extract_page_facts, resolve_parser_backend
 from config.ai_config import ImageConfig
+from config.crawler_config import CrawlerConfig
+
+# _check_image result for an image whose requests failed: neither within limits nor large
+IMAGE_NOT_CHECKED = object()
 
 
 class RecursiveCrawler:
-    def __init__(self):
-        self.visited_urls: Set[str] = set()
-        self.to_visit: List[str] = []
+    def __init__(self, parser_backend: Optional[str] = None, client: Optional[HttpClient] = None,
+                 parse_workers: int = CrawlerConfig.PARSE_WORKERS,
+                 robots: Optional[RobotsCache] = None,
+                 compact_seen_set: bool = CrawlerConfig.COMPACT_SEEN_SET):
+        self.host_stats = HostStats()
+        self.breaker = CircuitBreaker()
+        self.client = TrackedClient(client or http_client, self.host_stats, self.breaker)
+        self.robots = robots or robots_cache
+        self.parse_workers = min(parse_workers, os.cpu_count() or 1)
+        self.parse_pool: Optional[ProcessPoolExecutor] = None
+        # Link/image checks of every page in flight share these threads
+        self.check_pool: Optional[ThreadPoolExecutor] = None
+        self._check_pool_lock = threading.Lock()
+        self.parser_backend = resolve_parser_backend(parser_backend)
+        self.compact_seen_set = compact_seen_set
+        self.visited_urls = self._new_seen_set()
+        self.to_visit = CrawlFrontier(self._new_seen_set())
+        self.disallowed_urls: Set[str] = set()
+        # Pages set aside while their host's circuit is open: (due time, URL, depth)
+        self.deferred: List[Tuple[float, str, int]] = []
         self.max_pages = 50
         self.domain = ""
+        self.scheduler = HostScheduler(CrawlerConfig.HOST_MIN_INTERVAL_SECONDS)
+        self.link_status_cache = CoalescingCache()
+        self.image_cache = ImageMetadataCache()
+        self.previous_pages: Dict[str, Dict] = {}
         
+    def _new_seen_set(self):
+        if self.compact_seen_set:
+            return CompactSeenSet(CrawlerConfig.SEEN_SET_EXPECTED_URLS, CrawlerConfig.SEEN_SET_FALSE_POSITIVE_RATE)
+        return set()
+    
     @staticmethod
     def is_same_domain(url: str, base_domain: str) -> bool:
         try:
@@ -28,58 +78,96 @@ class RecursiveCrawler:
     
     @staticmethod
     def normalize_url(url: str) -> str:
-        try:
-            parsed = urlparse(url)
-            if not parsed.scheme:
-                url = 'https://' + url
-                parsed = urlparse(url)
-            
-            normalized = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
-            if parsed.query:
-                params = sorted(parsed.query.split('&'))
-                normalized += '?' + '&'.join(params)
-            return normalized.rstrip('/')
-        except Exception as e:
-            print(f"URL normalization failed for {url}: {str(e)}")
-            return url
+        return normalize_url(url)
+    
+    def is_allowed(self, url: str) -> bool:
+        """Whether robots.txt lets us crawl the URL (always True with RESPECT_ROBOTS_TXT off)"""
+        if not CrawlerConfig.RESPECT_ROBOTS_TXT:
+            return True
+        if url in self.disallowed_urls:
+            return False
+        if self.robots.can_fetch(url, self.client, self.scheduler):
+            return True
+        print(f"Skipping (disallowed by robots.txt): {url}")
+        self.disallowed_urls.add(url)
+        return False
+    
+    def enqueue(self, url: str, depth: int = 0, sitemap_priority: Optional[float] = None,
+                lastmod: Optional[str] = None, inbound: int = 0) -> bool:
+        """
+        Add a URL to the frontier unless it was queued before or robots.txt disallows it.
+        A URL still waiting in the frontier is re-ranked with the new depth/link information.
+        """
+        if url not in self.to_visit and not self.is_allowed(url):
+            return False
+        return self.to_visit.push(url, depth, sitemap_priority, lastmod, inbound)
     
-    def extract_links(self, html_content: str, base_url: str) -> List[str]:
-        """Extract all links from HTML content"""
-        soup = BeautifulSoup(html_content, 'html.parser')
-        links = []
+    def apply_robots_rules(self, base_url: str):
+        """Use the site's robots.txt Crawl-delay as the interval for its host"""
+        if not CrawlerConfig.RESPECT_ROBOTS_TXT:
+            return
         
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-            if not href or href.startswith(('javascript:', 'mailto:', 'tel:', '#')):
-                continue
-                
-            try:
-                full_url = urljoin(base_url, href)
-                normalized_url = self.normalize_url(full_url)
-                
-                if (self.is_same_domain(full_url, self.domain) and
-                    normalized_url not in self.visited_urls and
-                    normalized_url not in self.to_visit and
-                    not any(ext in full_url.lower() for ext in ['.pdf', '.jpg', '.png', '.doc', '.docx', '.zip'])):
-                    links.append(normalized_url)
-            except Exception as e:
-                print(f"Error processing link {href}: {str(e)}")
-                continue
-                
-        return list(set(links))
+        rules = self.robots.get(base_url, self.client, self.scheduler)
+        delay = rules.crawl_delay
+        if delay:
+            interval = min(max(delay, self.scheduler.min_interval), CrawlerConfig.MAX_CRAWL_DELAY_SECONDS)
+            self.scheduler.set_host_interval(urlparse(base_url).netloc, interval)
+            print(f"robots.txt Crawl-delay: {delay}s (using {interval}s between requests)")
+    
+    def extract_links(self, anchors: List[Tuple[str, str]], base_url: str) -> List[str]:
+        """Extract crawlable same-domain links from a page's anchors (including queued ones: they count as inbound links)"""
+        return normalize_links(base_url, (href for href, _ in anchors), self.domain)
     
-    def check_broken_links(self, html_content: str, base_url: str) -> List[Dict]:
+    def _fetch_link_status(self, full_url: str, headers: dict) -> Dict:
+        """
+        Status of one link, from the store or a HEAD request. CircuitOpenError is
+        raised, not returned: the host being unavailable says nothing about the
+        link, and the crawl cache does not keep failed computations.
+        """
+        stored = link_status_store.get(full_url)
+        if stored:
+            return stored
+        
+        try:
+            response = resource_probe.head(self.client, full_url, headers, timeout=5, allow_redirects=True,
+                                           scheduler=self.scheduler)
+            result = {
+                'status_code': response.status_code,
+                'final_url': str(response.url),
+                'redirected': len(response.history) > 0
+            }
+        except CircuitOpenError:
+            raise
+        except requests.exceptions.RequestException as e:
+            result = {'status_code': 0, 'error': str(e)[:100]}
+        
+        link_status_store.save(full_url, result)
+        return result
+    
+    def _check_link(self, full_url: str, headers: dict) -> Optional[Dict]:
+        """
+        Link status for the whole crawl: shared nav/footer links are requested once.
+        None if the link's host circuit is open; a later page asks again.
+        """
+        try:
+            return self.link_status_cache.get_or_compute(
+                urldefrag(full_url)[0],
+                lambda: self._fetch_link_status(full_url, headers)
+            )
+        except CircuitOpenError:
+            return None
+    
+    def check_broken_links(self, anchors: List[Tuple[str, str]], base_url: str) -> List[Dict]:
         """Check all links in content and identify broken ones (404/410)"""
-        soup = BeautifulSoup(html_content, 'html.parser')
         broken_links = []
         checked_urls = set()
+        links_to_check = []
         
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
         
-        for link in soup.find_all('a', href=True):
-            href = link['href']
+        for href, link_text in anchors:
             if not href or href.startswith(('javascript:', 'mailto:', 'tel:', '#')):
                 continue
                 
@@ -89,59 +177,52 @@ class RecursiveCrawler:
                 if full_url in checked_urls:
                     continue
                 checked_urls.add(full_url)
-                
-                try:
-                    response = requests.head(full_url, headers=headers, timeout=5, allow_redirects=True)
-                    status_code = response.status_code
-                    
-                    if status_code in [404, 410]:
-                        broken_links.append({
-                            'url': full_url,
-                            'status_code': status_code,
-                            'link_text': link.get_text(strip=True)[:100],
-                            'found_on_page': base_url
-                        })
-                except requests.exceptions.RequestException as e:
-                    broken_links.append({
-                        'url': full_url,
-                        'status_code': 0,
-                        'error': str(e)[:100],
-                        'link_text': link.get_text(strip=True)[:100],
-                        'found_on_page': base_url
-                    })
-                    
-                time.sleep(0.1)
+                links_to_check.append((full_url, link_text))
                     
             except Exception as e:
                 print(f"Error checking link {href}: {str(e)}")
                 continue
         
+        results = self._checks().map(lambda item: self._check_link(item[0], headers), links_to_check)
+        unchecked = 0
+        for (full_url, link_text), result in zip(links_to_check, results):
+            if result is None:
+                unchecked += 1
+            elif result['status_code'] in [404, 410]:
+                broken_links.append({
+                    'url': full_url,
+                    'status_code': result['status_code'],
+                    'link_text': link_text,
+                    'found_on_page': base_url
+                })
+            elif result['status_code'] == 0:
+                broken_links.append({
+                    'url': full_url,
+                    'status_code': 0,
+                    'error': result.get('error', ''),
+                    'link_text': link_text,
+                    'found_on_page': base_url
+                })
+        
+        if unchecked:
+            print(f"  {unchecked} links on {base_url} not checked (host circuit open)")
+        
         return broken_links
 
     @staticmethod
-    def check_image_dimensions(img_url: str, headers: dict) -> Dict:
+    def check_image_dimensions(img_url: str, headers: dict, client: Optional[HttpClient] = None,
+                               scheduler: Optional[HostScheduler] = None) -> Dict:
         """
         Check image dimensions to determine if it's a banner.
         Returns: {'is_banner': bool, 'width': int, 'height': int}
+        Request failures (including CircuitOpenError) are raised, not returned as
+        width 0: they say nothing about the image, and caches must not keep them.
         """
         try:
-            from PIL import Image
-            from io import BytesIO
-            
-            # Download image (limit to first 500KB to avoid huge downloads)
-            response = requests.get(img_url, headers=headers, timeout=5, stream=True)
-            response.raw.decode_content = True
-            
-            # Read only what we need
-            img_data = BytesIO()
-            for chunk in response.iter_content(chunk_size=8192):
-                img_data.write(chunk)
-                if img_data.tell() > 500 * 1024:  # Stop after 500KB
-                    break
-            
-            img_data.seek(0)
-            img = Image.open(img_data)
-            width, height = img.size
+            size = probe_image_dimensions(img_url, headers, client, scheduler=scheduler)
+            if size is None:
+                raise ValueError("image header not found")
+            width, height = size
             
             # Check if it's a banner: width >= 1200 AND aspect ratio >= 2.5
             aspect_ratio = width / height if height > 0 else 0
@@ -154,15 +235,22 @@ class RecursiveCrawler:
                 'aspect_ratio': round(aspect_ratio, 2)
             }
             
+        except requests.exceptions.RequestException:
+            raise
         except Exception as e:
             print(f"Could not check dimensions for {img_url}: {str(e)}")
             return {'is_banner': False, 'width': 0, 'height': 0, 'aspect_ratio': 0}
 
     @staticmethod
-    def is_banner_image(img, img_url: str, file_size_kb: float, headers: dict) -> Dict:
+    def is_banner_image(img, img_url: str, file_size_kb: float, headers: dict,
+                        client: Optional[HttpClient] = None,
+                        image_cache: Optional[ImageMetadataCache] = None,
+                        metadata: Optional[Dict] = None,
+                        scheduler: Optional[HostScheduler] = None) -> Dict:
         """
         Determine if image is a banner using multiple detection methods.
         Returns: {'is_banner': bool, 'detection_method': str, 'dimensions': dict}
+        Raises requests' RequestException if the dimension check could not be made.
         """
         # Method 1: Check keywords in filename/class
         img_src = img.get('src', '').lower()
@@ -189,8 +277,14 @@ class RecursiveCrawler:
                 'dimensions': {}
             }
         
-        # Method 3: Check actual dimensions
-        dim_check = RecursiveCrawler.check_image_dimensions(img_url, headers)
+        # Method 3: Check actual dimensions (once per image per crawl when a cache is given)
+        if image_cache:
+            dim_check = image_cache.dimensions(
+                img_url, metadata or {},
+                lambda: RecursiveCrawler.check_image_dimensions(img_url, headers, client, scheduler)
+            )
+        else:
+            dim_check = RecursiveCrawler.check_image_dimensions(img_url, headers, client, scheduler)
         if dim_check['is_banner']:
             return {
                 'is_banner': True,
@@ -204,21 +298,103 @@ class RecursiveCrawler:
             'dimensions': dim_check if dim_check['width'] > 0 else {}
         }
     
-    def check_large_images(self, html_content: str, base_url: str) -> List[Dict]:
+    def _fetch_image_head(self, full_img_url: str, headers: dict) -> Dict:
+        return self.image_cache.fetch(full_img_url, headers, self.client, timeout=5, scheduler=self.scheduler)
+    
+    def _check_image(self, img, full_img_url: str, base_url: str, headers: dict):
+        """
+        HEAD one image (once per crawl) and return its large-image entry, None if it is
+        within limits, or IMAGE_NOT_CHECKED if a request failed (nothing is cached then)
+        """
+        try:
+            metadata = self.image_cache.head(full_img_url, lambda: self._fetch_image_head(full_img_url, headers))
+            
+            if metadata['status_code'] != 200:
+                return None
+            
+            if not metadata['content_length']:
+                return None
+            
+            file_size_bytes = metadata['content_length']
+            file_size_kb = file_size_bytes / 1024
+            file_size_mb = file_size_kb / 1024
+            
+            # Use combined detection
+            banner_check = self.is_banner_image(img, full_img_url, file_size_kb, headers, self.client,
+                                                self.image_cache, metadata, self.scheduler)
+            is_banner = banner_check['is_banner']
+            
+            # Apply thresholds based on image type
+            if is_banner:
+                # Banner: flag if > 2MB
+                if file_size_bytes > ImageConfig.BANNER_MAX_THRESHOLD_BYTES:
+                    image_filename = full_img_url.split('/')[-1].split('?')[0]
+                    
+                    return {
+                        'url': full_img_url,
+                        'filename': image_filename,
+                        'size_bytes': file_size_bytes,
+                        'size_kb': round(file_size_kb, 2),
+                        'size_mb': round(file_size_mb, 2),
+                        'size_exact': metadata['size_exact'],
+                        'alt_text': img.get('alt', 'No alt text')[:100],
+                        'found_on_page': base_url,
+                        'is_banner': True,
+                        'detection_method': banner_check['detection_method'],
+                        'dimensions': banner_check.get('dimensions', {}),
+                        'severity': 'critical',
+                        'threshold_type': 'banner',
+                        'max_allowed_kb': ImageConfig.BANNER_MAX_THRESHOLD_KB,
+                        'recommendation': f"Banner image exceeds 2MB limit ({file_size_kb:.1f}KB). Optimize to under 2MB.",
+                        'percentage_over': round((file_size_kb / ImageConfig.BANNER_MAX_THRESHOLD_KB) * 100, 0)
+                    }
+            else:
+                # Regular image: flag if > 400KB
+                if file_size_bytes > ImageConfig.REGULAR_LARGE_THRESHOLD_BYTES:
+                    image_filename = full_img_url.split('/')[-1].split('?')[0]
+                    
+                    return {
+                        'url': full_img_url,
+                        'filename': image_filename,
+                        'size_bytes': file_size_bytes,
+                        'size_kb': round(file_size_kb, 2),
+                        'size_mb': round(file_size_mb, 2),
+                        'size_exact': metadata['size_exact'],
+                        'alt_text': img.get('alt', 'No alt text')[:100],
+                        'found_on_page': base_url,
+                        'is_banner': False,
+                        'detection_method': banner_check['detection_method'],
+                        'dimensions': banner_check.get('dimensions', {}),
+                        'severity': 'critical',
+                        'threshold_type': 'regular',
+                        'max_allowed_kb': ImageConfig.REGULAR_LARGE_THRESHOLD_KB,
+                        'recommendation': f"Regular image exceeds 400KB limit ({file_size_kb:.1f}KB). Optimize to under 400KB.",
+                        'percentage_over': round((file_size_kb / ImageConfig.REGULAR_LARGE_THRESHOLD_KB) * 100, 0)
+                    }
+            
+            return None
+            
+        except CircuitOpenError:
+            return IMAGE_NOT_CHECKED
+        except requests.exceptions.RequestException as e:
+            print(f"Error checking image {full_img_url}: {str(e)}")
+            return IMAGE_NOT_CHECKED
+    
+    def check_large_images(self, images: List[Dict], base_url: str) -> List[Dict]:
         """
         Check all images with enhanced banner detection
         - Banner images: OK up to 2MB
         - Regular images: considered large if > 400KB
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
         large_images = []
         checked_images = set()
+        images_to_check = []
         
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
         
-        for img in soup.find_all('img', src=True):
+        for img in images:
             img_url = img['src']
             
             try:
@@ -227,94 +403,126 @@ class RecursiveCrawler:
                 if full_img_url in checked_images:
                     continue
                 checked_images.add(full_img_url)
-                
-                try:
-                    response = requests.head(full_img_url, headers=headers, timeout=5)
-                    
-                    if response.status_code == 200:
-                        content_length = response.headers.get('content-length')
-                        
-                        if content_length:
-                            file_size_bytes = int(content_length)
-                            file_size_kb = file_size_bytes / 1024
-                            file_size_mb = file_size_kb / 1024
-                            
-                            # Use combined detection
-                            banner_check = self.is_banner_image(img, full_img_url, file_size_kb, headers)
-                            is_banner = banner_check['is_banner']
-                            
-                            # Apply thresholds based on image type
-                            if is_banner:
-                                # Banner: flag if > 2MB
-                                if file_size_bytes > ImageConfig.BANNER_MAX_THRESHOLD_BYTES:
-                                    image_filename = full_img_url.split('/')[-1].split('?')[0]
-                                    
-                                    large_images.append({
-                                        'url': full_img_url,
-                                        'filename': image_filename,
-                                        'size_bytes': file_size_bytes,
-                                        'size_kb': round(file_size_kb, 2),
-                                        'size_mb': round(file_size_mb, 2),
-                                        'alt_text': img.get('alt', 'No alt text')[:100],
-                                        'found_on_page': base_url,
-                                        'is_banner': True,
-                                        'detection_method': banner_check['detection_method'],
-                                        'dimensions': banner_check.get('dimensions', {}),
-                                        'severity': 'critical',
-                                        'threshold_type': 'banner',
-                                        'max_allowed_kb': ImageConfig.BANNER_MAX_THRESHOLD_KB,
-                                        'recommendation': f"Banner image exceeds 2MB limit ({file_size_kb:.1f}KB). Optimize to under 2MB.",
-                                        'percentage_over': round((file_size_kb / ImageConfig.BANNER_MAX_THRESHOLD_KB) * 100, 0)
-                                    })
-                            else:
-                                # Regular image: flag if > 400KB
-                                if file_size_bytes > ImageConfig.REGULAR_LARGE_THRESHOLD_BYTES:
-                                    image_filename = full_img_url.split('/')[-1].split('?')[0]
-                                    
-                                    large_images.append({
-                                        'url': full_img_url,
-                                        'filename': image_filename,
-                                        'size_bytes': file_size_bytes,
-                                        'size_kb': round(file_size_kb, 2),
-                                        'size_mb': round(file_size_mb, 2),
-                                        'alt_text': img.get('alt', 'No alt text')[:100],
-                                        'found_on_page': base_url,
-                                        'is_banner': False,
-                                        'detection_method': banner_check['detection_method'],
-                                        'dimensions': banner_check.get('dimensions', {}),
-                                        'severity': 'critical',
-                                        'threshold_type': 'regular',
-                                        'max_allowed_kb': ImageConfig.REGULAR_LARGE_THRESHOLD_KB,
-                                        'recommendation': f"Regular image exceeds 400KB limit ({file_size_kb:.1f}KB). Optimize to under 400KB.",
-                                        'percentage_over': round((file_size_kb / ImageConfig.REGULAR_LARGE_THRESHOLD_KB) * 100, 0)
-                                    })
-                    
-                    time.sleep(0.1)
-                        
-                except requests.exceptions.RequestException as e:
-                    print(f"Error checking image {full_img_url}: {str(e)}")
-                    continue
+                images_to_check.append((img, full_img_url))
                     
             except Exception as e:
                 print(f"Error processing image {img_url}: {str(e)}")
                 continue
         
+        results = list(self._checks().map(
+            lambda item: self._check_image(item[0], item[1], base_url, headers),
+            images_to_check
+        ))
+        unchecked = sum(1 for result in results if result is IMAGE_NOT_CHECKED)
+        large_images = [result for result in results if result and result is not IMAGE_NOT_CHECKED]
+        if unchecked:
+            print(f"  {unchecked} images on {base_url} not checked (request failed or host circuit open)")
+        
         large_images.sort(key=lambda x: x['size_bytes'], reverse=True)
         
         return large_images
     
+    @staticmethod
+    def _carry_forward(previous: Dict, load_time: float, response) -> Dict:
+        """Reuse the last crawl's results for a page that has not changed since"""
+        print(f"Unchanged since last crawl: {previous['url']}")
+        return {
+            **previous,
+            'load_time': load_time,
+            'links': [],
+            'etag': response.headers.get('etag') or previous.get('etag'),
+            'last_modified': response.headers.get('last-modified') or previous.get('last_modified'),
+            'not_modified': True
+        }
+    
+    @staticmethod
+    def _read_body(response: requests.Response, max_bytes: int) -> Tuple[bytes, bool]:
+        """Body of a streamed response, at most max_bytes of it. The flag is True if the body was cut short."""
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(64 * 1024):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= max_bytes:
+                return b''.join(chunks)[:max_bytes], True
+        return b''.join(chunks), False
+    
+    def _extract_facts(self, html_content: bytes) -> PageFacts:
+        """Parse in the process pool when one is running; only the compact PageFacts come back"""
+        if self.parse_pool:
+            return self.parse_pool.submit(extract_page_facts, html_content, self.parser_backend).result()
+        return extract_page_facts(html_content, self.parser_backend)
+    
+    def _open_parse_pool(self):
+        if self.parse_workers > 0 and not self.parse_pool:
+            # spawn, not fork: the API process has live threads and sockets
+            self.parse_pool = ProcessPoolExecutor(
+                max_workers=self.parse_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+    
+    def _checks(self) -> ThreadPoolExecutor:
+        """The crawler's check threads, created on first use: CHECK_WORKERS in total, however many pages are in flight"""
+        with self._check_pool_lock:
+            if self.check_pool is None:
+                self.check_pool = ThreadPoolExecutor(max_workers=CrawlerConfig.CHECK_WORKERS,
+                                                     thread_name_prefix="crawl-check")
+            return self.check_pool
+    
+    def close(self):
+        """Stop the crawler's worker threads and processes; they are started again when needed"""
+        self._close_parse_pool()
+        with self._check_pool_lock:
+            if self.check_pool:
+                self.check_pool.shutdown()
+                self.check_pool = None
+    
+    def _close_parse_pool(self):
+        if self.parse_pool:
+            self.parse_pool.shutdown()
+            self.parse_pool = None
+    
+    @staticmethod
+    def _error_page(url: str, error: Exception) -> Dict:
+        return {
+            'url': url,
+            'title': f"Error: {str(error)}",
+            'content': "",
+            'word_count': 0,
+            'status_code': 0,
+            'load_time': 0,
+            'links': [],
+            'broken_links': [],
+            'large_images': []
+        }
+    
     def scrape_page(self, url: str) -> Dict:
+        """Fetch and analyze one page. Raises CircuitOpenError if its host's circuit is open."""
         try:
-            start_time = time.time()
-            
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             }
             
-            response = requests.get(url, headers=headers, timeout=10)
+            previous = self.previous_pages.get(url)
+            if previous:
+                if previous.get('etag'):
+                    headers['If-None-Match'] = previous['etag']
+                if previous.get('last_modified'):
+                    headers['If-Modified-Since'] = previous['last_modified']
+            
+            self.scheduler.wait(url)
+            start_time = time.time()
+            # Streamed: the headers decide whether the body is read at all, and how much of it
+            # The page's own timeout, not the host's adaptive one: a slow page is a finding, not an error
+            with self.client.get(url, headers=headers, timeout=10, stream=True, adaptive_timeout=False) as response:
+                if previous and response.status_code == 304:
+                    return self._carry_forward(previous, time.time() - start_time, response)
+                
+                content_type = response.headers.get('content-type', '')
+                if 'text/html' in content_type:
+                    body, truncated = self._read_body(response, CrawlerConfig.MAX_BODY_BYTES)
             load_time = time.time() - start_time
             
-            content_type = response.headers.get('content-type', '')
             if 'text/html' not in content_type:
                 return {
                     'url': url,
@@ -328,63 +536,100 @@ class RecursiveCrawler:
                     'large_images': []
                 }
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            title = soup.title.string if soup.title else "No title found"
+            if truncated:
+                print(f"Body of {url} is over {CrawlerConfig.MAX_BODY_BYTES} bytes, only that much was parsed")
+            
+            content_hash = hashlib.sha256(body).hexdigest()
+            if previous and previous.get('content_hash') == content_hash:
+                return self._carry_forward(previous, load_time, response)
+            
+            facts = self._extract_facts(body)
             
             print(f"Checking broken links on {url}...")
-            broken_links = self.check_broken_links(response.content, url)
+            broken_links = self.check_broken_links(facts.anchors, url)
             
             print(f"Checking images on {url} (thresholds: Regular: {ImageConfig.REGULAR_LARGE_THRESHOLD_KB}KB, Banner: {ImageConfig.BANNER_MAX_THRESHOLD_KB}KB)...")
-            large_images = self.check_large_images(response.content, url)
+            large_images = self.check_large_images(facts.images, url)
             
             if large_images:
                 banner_count = sum(1 for img in large_images if img['is_banner'])
                 regular_count = sum(1 for img in large_images if not img['is_banner'])
                 print(f"  Found {len(large_images)} large images: {banner_count} banners over 2MB, {regular_count} regular images over 400KB")
             
-            for element in soup(["script", "style", "nav", "header", "footer", "aside"]):
-                element.decompose()
-            
-            text_content = soup.get_text()
-            lines = (line.strip() for line in text_content.splitlines())
-            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-            clean_content = ' '.join(chunk for chunk in chunks if chunk)
-            
-            if len(clean_content) > 10000:
-                clean_content = clean_content[:10000] + "... [content truncated]"
-            
-            links = self.extract_links(response.content, url)
+            links = self.extract_links(facts.anchors, url)
             
             return {
                 'url': url,
-                'title': title,
-                'content': clean_content,
-                'word_count': len(clean_content.split()),
+                'title': facts.title,
+                'content': facts.content,
+                'word_count': len(facts.content.split()),
                 'status_code': response.status_code,
                 'load_time': load_time,
                 'links': links,
                 'broken_links': broken_links,
-                'large_images': large_images
+                'large_images': large_images,
+                'etag': response.headers.get('etag'),
+                'last_modified': response.headers.get('last-modified'),
+                'content_hash': content_hash,
+                'not_modified': False,
+                'body_truncated': truncated
             }
             
+        except CircuitOpenError:
+            raise
         except Exception as e:
             print(f"Error scraping {url}: {str(e)}")
-            return {
-                'url': url,
-                'title': f"Error: {str(e)}",
-                'content': "",
-                'word_count': 0,
-                'status_code': 0,
-                'load_time': 0,
-                'links': [],
-                'broken_links': [],
-                'large_images': []
-            }
+            return self._error_page(url, e)
+    
+    def _scrape_or_defer(self, url: str, depth: int) -> Optional[Dict]:
+        """
+        scrape_page, except that a page whose host circuit is open is set aside
+        (None) and requeued once the breaker lets requests through again.
+        It becomes an error page only when the breaker considers the host down.
+        """
+        try:
+            return self.scrape_page(url)
+        except CircuitOpenError as e:
+            if self.breaker.is_down(url):
+                print(f"Error scraping {url}: {str(e)}")
+                return self._error_page(url, e)
+            self.deferred.append((time.monotonic() + self.breaker.retry_in(url), url, depth))
+            print(f"Deferred (host circuit open): {url}")
+            return None
+    
+    def _release_deferred(self) -> Optional[float]:
+        """Requeue deferred pages that are due. Returns seconds until the next one is, None if none are left."""
+        now = time.monotonic()
+        pending = []
+        for due, url, depth in self.deferred:
+            if due <= now:
+                self.to_visit.requeue(url, depth)
+            else:
+                pending.append((due, url, depth))
+        self.deferred = pending
+        return min(due for due, _, _ in pending) - now if pending else None
     
-    def crawl_website(self, base_url: str, max_pages: int = 50) -> List[Dict]:
+    def _start_crawl(self, base_url: str, max_pages: int, previous_pages: Optional[Dict[str, Dict]] = None,
+                     max_depth: Optional[int] = None, path_budgets: Optional[Dict[str, int]] = None) -> str:
+        """
+        Reset crawl state and seed the frontier from the base URL and its sitemap.
+        previous_pages (normalized URL -> page dict from the last crawl) turns on
+        conditional re-fetching; those URLs are queued too, since unchanged pages
+        are not parsed for new links.
+        max_depth (link hops from the base URL) and path_budgets (path prefix -> most
+        pages crawled under it) limit what the frontier hands out.
+        """
         self.max_pages = max_pages
+        self.previous_pages = previous_pages or {}
         self.visited_urls.clear()
-        self.to_visit.clear()
+        self.to_visit = CrawlFrontier(self._new_seen_set(), max_depth, path_budgets)
+        self.disallowed_urls.clear()
+        self.deferred = []
+        self.scheduler.reset()
+        self.link_status_cache.clear()
+        self.image_cache.clear()
+        self.host_stats.reset()
+        self.breaker.reset()
         
         base_url = self.normalize_url(base_url)
         parsed_base = urlparse(base_url)
@@ -396,40 +641,35 @@ class RecursiveCrawler:
         print(f"Starting crawl for domain: {self.domain}")
         print(f"Image thresholds: Regular images: {ImageConfig.REGULAR_LARGE_THRESHOLD_KB}KB, Banner images: {ImageConfig.BANNER_MAX_THRESHOLD_KB}KB")
         
-        self.to_visit.append(base_url)
-        scraped_pages = []
+        self.apply_robots_rules(base_url)
+        self.enqueue(base_url)
         
         try:
-            sitemap_url = SitemapParser.find_sitemap_url(base_url)
-            if sitemap_url:
+            for sitemap_url in SitemapParser.find_sitemap_urls(base_url, self.client, self.scheduler, self.robots):
                 print(f"Found sitemap: {sitemap_url}")
-                sitemap_urls = SitemapParser.parse_sitemap(sitemap_url)
-                for url in sitemap_urls:
-                    if self.is_same_domain(url, self.domain):
-                        normalized = self.normalize_url(url)
-                        if normalized not in self.visited_urls and normalized not in self.to_visit:
-                            self.to_visit.append(normalized)
+                # Read lazily: the crawl visits at most max_pages URLs, so stop once that many are queued
+                for entry in SitemapParser.iter_sitemap(sitemap_url, self.client, scheduler=self.scheduler):
+                    if len(self.to_visit) >= self.max_pages:
+                        break
+                    if self.is_same_domain(entry['loc'], self.domain):
+                        # Sitemap pages count as one hop from the base URL
+                        self.enqueue(self.normalize_url(entry['loc']), 1, entry['priority'], entry['lastmod'])
         except Exception as e:
             print(f"Sitemap processing failed: {str(e)}")
         
-        while self.to_visit and len(self.visited_urls) < self.max_pages:
-            current_url = self.to_visit.pop(0)
-            
-            if current_url in self.visited_urls:
-                continue
-                
-            print(f"Crawling ({len(self.visited_urls)+1}/{self.max_pages}): {current_url}")
-            page_data = self.scrape_page(current_url)
-            self.visited_urls.add(current_url)
-            
-            scraped_pages.append(page_data)
-            
-            for link in page_data['links']:
-                if link not in self.visited_urls and link not in self.to_visit:
-                    self.to_visit.append(link)
-            
-            time.sleep(0.5)
+        for url in self.previous_pages:
+            self.enqueue(url, 1)
         
+        return base_url
+    
+    def crawl_metrics(self) -> Dict:
+        return {
+            'hosts': self.host_stats.snapshot(),
+            'circuit_breakers': self.breaker.snapshot(),
+            'frontier': self.to_visit.stats()
+        }
+    
+    def _print_summary(self, scraped_pages: List[Dict]):
         print(f"Crawling completed. Found {len(scraped_pages)} pages.")
         
         total_broken_links = sum(len(page['broken_links']) for page in scraped_pages)
@@ -449,15 +689,239 @@ class RecursiveCrawler:
         print(f"  - Banner images over 2MB: {banner_images}")
         print(f"  - Regular images over 400KB: {regular_images}")
         
+        if self.disallowed_urls:
+            print(f"Skipped (disallowed by robots.txt): {len(self.disallowed_urls)}")
+        
+        if self.previous_pages:
+            unchanged = sum(1 for page in scraped_pages if page.get('not_modified'))
+            print(f"Unchanged since last crawl (not re-parsed): {unchanged}")
+        
+        frontier_stats = self.to_visit.stats()
+        if frontier_stats['over_depth'] or frontier_stats['over_budget']:
+            print(f"Frontier: {frontier_stats['over_depth']} links beyond max depth, "
+                  f"{frontier_stats['over_budget']} over their path budget, {frontier_stats['queued']} left queued")
+        
+        truncated = sum(1 for page in scraped_pages if page.get('body_truncated'))
+        if truncated:
+            print(f"Pages cut at {CrawlerConfig.MAX_BODY_BYTES} bytes: {truncated}")
+        
+        client_stats = self.client.stats()
+        print(f"HTTP connections: {client_stats['connections_opened']} opened for "
+              f"{client_stats['requests']} requests (reuse ratio {client_stats['reuse_ratio']:.0%})")
+        
+        link_stats = self.link_status_cache.stats()
+        print(f"Link checks: {link_stats['misses']} distinct URLs requested, "
+              f"{link_stats['hits'] + link_stats['coalesced']} answered from the crawl cache")
+        
+        image_stats = self.image_cache.stats()
+        print(f"Image checks: {image_stats['head_requests']} HEAD requests for {image_stats['images']} images, "
+              f"{image_stats['head_reused']} reused, {image_stats['size_from_store']} sizes from store; "
+              f"{image_stats['dimension_checks']} dimension probes, "
+              f"{image_stats['dimension_reused'] + image_stats['dimension_from_store']} reused")
+        
+        for host, stats in list(self.host_stats.snapshot().items())[:3]:
+            print(f"Host {host}: {stats['requests']} requests, {stats['total_time_s']}s total, "
+                  f"p95 {stats['p95_ms']}ms, {stats['failures']} failures, {stats['retries']} retries")
+        
+        for host, circuit in self.breaker.snapshot().items():
+            print(f"Circuit for {host}: {circuit['state']}, opened {circuit['times_opened']} times, "
+                  f"{circuit['rejected']} requests failed fast")
+    
+    def crawl_website(self, base_url: str, max_pages: int = 50,
+                      previous_pages: Optional[Dict[str, Dict]] = None,
+                      on_page: Optional[Callable[[Dict], None]] = None,
+                      max_depth: Optional[int] = None,
+                      path_budgets: Optional[Dict[str, int]] = None) -> List[Dict]:
+        self._start_crawl(base_url, max_pages, previous_pages, max_depth, path_budgets)
+        scraped_pages = []
+        
+        # No parse pool here: pages are fetched one at a time, so the loop would just wait on each parse
+        try:
+            while len(self.visited_urls) < self.max_pages:
+                wait = self._release_deferred()
+                if not self.to_visit:
+                    if wait is None:
+                        break
+                    time.sleep(wait)
+                    continue
+                
+                entry = self.to_visit.pop_entry()
+                if entry is None:
+                    continue
+                current_url, depth = entry
+                
+                if current_url in self.visited_urls:
+                    continue
+                    
+                print(f"Crawling ({len(self.visited_urls)+1}/{self.max_pages}): {current_url}")
+                page_data = self._scrape_or_defer(current_url, depth)
+                if page_data is None:
+                    continue
+                page_data['depth'] = depth
+                self.visited_urls.add(current_url)
+                
+                scraped_pages.append(page_data)
+                if on_page:
+                    on_page(page_data)
+                
+                for link in page_data['links']:
+                    self.enqueue(link, depth + 1, inbound=1)
+        finally:
+            self.close()
+        
+        self._print_summary(scraped_pages)
+        
+        return scraped_pages
+    
+    async def _scrape_page_async(self, url: str, depth: int, page_pool: ThreadPoolExecutor,
+                                 global_slots: asyncio.Semaphore, host_slots: Dict[str, asyncio.Semaphore],
+                                 per_host_concurrency: int) -> Tuple[str, int, Optional[Dict]]:
+        host = urlparse(url).netloc
+        if host not in host_slots:
+            host_slots[host] = asyncio.Semaphore(per_host_concurrency)
+        
+        async with global_slots, host_slots[host]:
+            loop = asyncio.get_running_loop()
+            page_data = await loop.run_in_executor(page_pool, self._scrape_or_defer, url, depth)
+        
+        return url, depth, page_data
+    
+    async def crawl_website_async(self, base_url: str, max_pages: int = 50,
+                                  max_concurrency: int = CrawlerConfig.MAX_CONCURRENCY,
+                                  per_host_concurrency: int = CrawlerConfig.PER_HOST_CONCURRENCY,
+                                  previous_pages: Optional[Dict[str, Dict]] = None,
+                                  on_page: Optional[Callable[[Dict], None]] = None,
+                                  max_depth: Optional[int] = None,
+                                  path_budgets: Optional[Dict[str, int]] = None) -> List[Dict]:
+        """
+        Crawl with several pages in flight at once.
+        Returns the same page dicts as crawl_website, in completion order.
+        """
+        await asyncio.to_thread(self._start_crawl, base_url, max_pages, previous_pages, max_depth, path_budgets)
+        scraped_pages = []
+        
+        global_slots = asyncio.Semaphore(max_concurrency)
+        host_slots: Dict[str, asyncio.Semaphore] = {}
+        in_flight = set()
+        # One thread per page in flight; the loop's default executor would cap max_concurrency at min(32, cpus + 4)
+        page_pool = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="crawl-page")
+        
+        await asyncio.to_thread(self._open_parse_pool)
+        try:
+            while True:
+                wait = self._release_deferred()
+                # Pages in flight count toward max_pages; they become visited when they complete (not if deferred)
+                while (self.to_visit and len(in_flight) < max_concurrency and
+                       len(self.visited_urls) + len(in_flight) < self.max_pages):
+                    entry = self.to_visit.pop_entry()
+                    if entry is None:
+                        break
+                    current_url, depth = entry
+                    
+                    if current_url in self.visited_urls:
+                        continue
+                    
+                    print(f"Crawling ({len(self.visited_urls)+len(in_flight)+1}/{self.max_pages}): {current_url}")
+                    in_flight.add(asyncio.create_task(
+                        self._scrape_page_async(current_url, depth, page_pool, global_slots, host_slots,
+                                                per_host_concurrency)
+                    ))
+                
+                if not in_flight:
+                    if wait is None or len(self.visited_urls) >= self.max_pages:
+                        break
+                    await asyncio.sleep(wait)
+                    continue
+                
+                done, in_flight = await asyncio.wait(in_flight, timeout=wait, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    current_url, depth, page_data = task.result()
+                    if page_data is None:
+                        continue
+                    page_data['depth'] = depth
+                    self.visited_urls.add(current_url)
+                    scraped_pages.append(page_data)
+                    if on_page:
+                        on_page(page_data)
+                    
+                    for link in page_data['links']:
+                        self.enqueue(link, depth + 1, inbound=1)
+        finally:
+            # Only non-empty when the crawl failed or was cancelled
+            for task in in_flight:
+                task.cancel()
+            # Off the loop: running pages finish their fetch (and use the check pool) before close();
+            # pages that have not started are dropped
+            await asyncio.to_thread(page_pool.shutdown, cancel_futures=True)
+            await asyncio.to_thread(self.close)
+        
+        self._print_summary(scraped_pages)
+        
         return scraped_pages
 
 
 class RecursiveCrawlerController:
     @staticmethod
-    def crawl_website_recursive(website_data: WebsiteCreate, session: Session, current_user: User):
+    def build_webpage(page_data: Dict, website_id: int) -> WebPage:
+        return WebPage(
+            url=page_data['url'],
+            title=page_data['title'],
+            scraped_content=page_data['content'],
+            word_count=page_data['word_count'],
+            status_code=page_data['status_code'],
+            load_time=page_data['load_time'],
+            website_id=website_id,
+            broken_links_data=json.dumps(page_data['broken_links']),
+            large_images_data=json.dumps(page_data['large_images']),
+            etag=page_data.get('etag'),
+            last_modified=page_data.get('last_modified'),
+            content_hash=page_data.get('content_hash')
+        )
+    
+    @staticmethod
+    def load_previous_pages(base_url: str, session: Session, current_user: User) -> Dict[str, Dict]:
+        """Pages of the user's latest crawl of this site, keyed by normalized URL"""
+        statement = select(Website).where(
+            Website.user_id == current_user.id,
+            Website.base_url == base_url
+        ).order_by(Website.created_at.desc())
+        website = session.exec(statement).first()
+        if not website:
+            return {}
+        
+        pages = session.exec(select(WebPage).where(WebPage.website_id == website.id)).all()
+        previous_pages = {}
+        for page in pages:
+            if not page.content_hash:
+                continue
+            previous_pages[normalize_url(page.url)] = {
+                'url': page.url,
+                'title': page.title,
+                'content': page.scraped_content or "",
+                'word_count': page.word_count,
+                'status_code': page.status_code,
+                'broken_links': json.loads(page.broken_links_data) if page.broken_links_data else [],
+                'large_images': json.loads(page.large_images_data) if page.large_images_data else [],
+                'etag': page.etag,
+                'last_modified': page.last_modified,
+                'content_hash': page.content_hash
+            }
+        
+        print(f"Incremental crawl: {len(previous_pages)} pages from crawl {website.id} can be carried forward")
+        return previous_pages
+    
+    @staticmethod
+    def crawl_website_recursive(website_data: WebsiteCreate, session: Session, current_user: User,
+                                on_page: Optional[Callable[[Dict], None]] = None):
         try:
             crawler = RecursiveCrawler()
             
+            previous_pages = None
+            if website_data.incremental:
+                previous_pages = RecursiveCrawlerController.load_previous_pages(
+                    website_data.base_url, session, current_user
+                )
+            
             website = Website(
                 base_url=website_data.base_url,
                 user_id=current_user.id
@@ -466,26 +930,30 @@ class RecursiveCrawlerController:
             session.commit()
             session.refresh(website)
             
-            scraped_pages = crawler.crawl_website(
-                website_data.base_url,
-                website_data.max_pages
-            )
+            if website_data.engine == "async":
+                scraped_pages = asyncio.run(crawler.crawl_website_async(
+                    website_data.base_url,
+                    website_data.max_pages,
+                    website_data.max_concurrency,
+                    website_data.per_host_concurrency,
+                    previous_pages,
+                    on_page,
+                    website_data.max_depth,
+                    website_data.path_budgets
+                ))
+            else:
+                scraped_pages = crawler.crawl_website(
+                    website_data.base_url,
+                    website_data.max_pages,
+                    previous_pages,
+                    on_page,
+                    website_data.max_depth,
+                    website_data.path_budgets
+                )
             
             stored_pages = []
             for page_data in scraped_pages:
-                import json
-                
-                webpage = WebPage(
-                    url=page_data['url'],
-                    title=page_data['title'],
-                    scraped_content=page_data['content'],
-                    word_count=page_data['word_count'],
-                    status_code=page_data['status_code'],
-                    load_time=page_data['load_time'],
-                    website_id=website.id,
-                    broken_links_data=json.dumps(page_data['broken_links']),
-                    large_images_data=json.dumps(page_data['large_images'])
-                )
+                webpage = RecursiveCrawlerController.build_webpage(page_data, website.id)
                 session.add(webpage)
                 stored_pages.append(webpage)
             
@@ -513,6 +981,8 @@ class RecursiveCrawlerController:
                 "created_at": website.created_at.isoformat(),
                 "user_id": website.user_id,
                 "page_count": len(stored_pages),
+                "unchanged_pages": sum(1 for page in scraped_pages if page.get('not_modified')),
+                "metrics": crawler.crawl_metrics(),
                 "pages": pages_data
             }
             
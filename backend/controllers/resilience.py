@@ -0,0 +1,180 @@
+import random
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+import requests
+from urllib3.exceptions import NameResolutionError
+from config.crawler_config import CrawlerConfig
+
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised instead of sending a request to a host whose circuit breaker is open"""
+
+
+def is_permanent_connection_error(error: Exception) -> bool:
+    """TLS failures and unresolvable host names: retrying soon will not change the outcome"""
+    if isinstance(error, requests.exceptions.SSLError):
+        return True
+    reason = getattr(error.args[0], 'reason', None) if error.args else None
+    return isinstance(reason, NameResolutionError)
+
+
+class RetryPolicy:
+    """
+    Which failed requests are worth another attempt, and how long to wait first.
+    Only idempotent methods (GET/HEAD) are retried, on connection failures
+    (refused, reset, connect timeout) and on 429/502/503/504. Read timeouts,
+    TLS errors and DNS failures are not retried: a slow host is left to adaptive
+    timeouts and the circuit breaker, and the others are not transient.
+    Waits are exponential with jitter (half fixed, half random) so retries to
+    one host spread out, or the server's Retry-After when it asks for a short one.
+    """
+
+    IDEMPOTENT_METHODS = ("GET", "HEAD")
+    RETRY_STATUSES = (429, 502, 503, 504)
+
+    def __init__(self, max_attempts: int = CrawlerConfig.RETRY_MAX_ATTEMPTS,
+                 base_delay: float = CrawlerConfig.RETRY_BASE_DELAY_SECONDS,
+                 max_delay: float = CrawlerConfig.RETRY_MAX_DELAY_SECONDS):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def should_retry(self, method: str, attempt: int, error: Optional[Exception] = None,
+                     response: Optional[requests.Response] = None) -> bool:
+        """Whether to try again after `attempt` (1-based) ended in `error` or `response`"""
+        if method.upper() not in self.IDEMPOTENT_METHODS or attempt >= self.max_attempts:
+            return False
+        if error is not None:
+            return (isinstance(error, requests.exceptions.ConnectionError) and
+                    not isinstance(error, CircuitOpenError) and
+                    not is_permanent_connection_error(error))
+        if response is None or response.status_code not in self.RETRY_STATUSES:
+            return False
+        return self.delay(attempt, response) is not None
+
+    def delay(self, attempt: int, response: Optional[requests.Response] = None) -> Optional[float]:
+        """Seconds to wait before the next attempt; None if the server's Retry-After is longer than max_delay"""
+        retry_after = response.headers.get('retry-after', '').strip() if response is not None else ''
+        if retry_after.isdigit():
+            seconds = float(retry_after)
+            return seconds if seconds <= self.max_delay else None
+
+        backoff = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return backoff / 2 + random.uniform(0, backoff / 2)
+
+
+class HostCircuit:
+    __slots__ = ('state', 'consecutive_failures', 'opened_at', 'times_opened', 'consecutive_openings',
+                 'rejected', 'trial_in_flight')
+
+    def __init__(self):
+        self.state = BREAKER_CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.times_opened = 0
+        self.consecutive_openings = 0
+        self.rejected = 0
+        self.trial_in_flight = False
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker. After `failure_threshold` consecutive failed
+    requests (connection errors, timeouts, 5xx; a retried request counts
+    once) a host's circuit opens and requests to it fail fast with
+    CircuitOpenError. After `reset_seconds` a single trial request goes
+    through (half-open): success closes the circuit, failure opens it for
+    another `reset_seconds`. A host whose circuit opened `max_openings` times
+    without a success in between is considered down (is_down).
+    """
+
+    def __init__(self, failure_threshold: int = CrawlerConfig.BREAKER_FAILURE_THRESHOLD,
+                 reset_seconds: float = CrawlerConfig.BREAKER_RESET_SECONDS,
+                 max_openings: int = CrawlerConfig.BREAKER_MAX_OPENINGS):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.max_openings = max_openings
+        self._hosts: Dict[str, HostCircuit] = {}
+        self._lock = threading.Lock()
+
+    def _circuit(self, url: str) -> HostCircuit:
+        host = urlparse(url).netloc
+        circuit = self._hosts.get(host)
+        if circuit is None:
+            circuit = self._hosts[host] = HostCircuit()
+        return circuit
+
+    def before_request(self, url: str):
+        """Raise CircuitOpenError unless the URL's host may be sent a request now"""
+        with self._lock:
+            circuit = self._circuit(url)
+            if circuit.state == BREAKER_CLOSED:
+                return
+            if circuit.state == BREAKER_OPEN and time.monotonic() - circuit.opened_at >= self.reset_seconds:
+                circuit.state = BREAKER_HALF_OPEN
+            if circuit.state == BREAKER_HALF_OPEN and not circuit.trial_in_flight:
+                circuit.trial_in_flight = True
+                return
+            circuit.rejected += 1
+
+        raise CircuitOpenError(f"{urlparse(url).netloc} circuit open after repeated failures")
+
+    def retry_in(self, url: str) -> float:
+        """Seconds until a request to the URL's host may be let through again (0 if it may now)"""
+        with self._lock:
+            circuit = self._circuit(url)
+            if circuit.state == BREAKER_OPEN:
+                return max(self.reset_seconds - (time.monotonic() - circuit.opened_at), 0.0)
+            if circuit.state == BREAKER_HALF_OPEN and circuit.trial_in_flight:
+                # Ask again soon: the trial request decides the circuit's next state
+                return 1.0
+            return 0.0
+
+    def is_down(self, url: str) -> bool:
+        """Whether the host kept failing its trial requests: max_openings openings in a row"""
+        with self._lock:
+            return self._circuit(url).consecutive_openings >= self.max_openings
+
+    def record_success(self, url: str):
+        with self._lock:
+            circuit = self._circuit(url)
+            circuit.state = BREAKER_CLOSED
+            circuit.consecutive_failures = 0
+            circuit.consecutive_openings = 0
+            circuit.trial_in_flight = False
+
+    def record_failure(self, url: str):
+        with self._lock:
+            circuit = self._circuit(url)
+            circuit.consecutive_failures += 1
+            circuit.trial_in_flight = False
+            if circuit.state == BREAKER_HALF_OPEN or (
+                    circuit.state == BREAKER_CLOSED and circuit.consecutive_failures >= self.failure_threshold):
+                circuit.state = BREAKER_OPEN
+                circuit.opened_at = time.monotonic()
+                circuit.times_opened += 1
+                circuit.consecutive_openings += 1
+
+    def reset(self):
+        with self._lock:
+            self._hosts.clear()
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Hosts whose circuit is not closed or has opened at least once"""
+        with self._lock:
+            return {
+                host: {
+                    'state': circuit.state,
+                    'consecutive_failures': circuit.consecutive_failures,
+                    'times_opened': circuit.times_opened,
+                    'rejected': circuit.rejected
+                }
+                for host, circuit in self._hosts.items()
+                if circuit.state != BREAKER_CLOSED or circuit.times_opened
+            }
@@ -0,0 +1,94 @@
+import re
+from typing import Optional, Tuple
+import requests
+from config.crawler_config import CrawlerConfig
+from controllers.http_client import HttpClient
+from controllers.host_scheduler import HostScheduler
+
+# Status codes servers use to say they do not implement HEAD
+HEAD_REJECTED_STATUSES = (405, 501)
+CONTENT_RANGE_TOTAL = re.compile(r'/(\d+)\s*$')
+
+
+def content_range_total(response) -> Optional[int]:
+    """Full resource size from a 206 response's Content-Range (bytes 0-99/12345), if the server gave it"""
+    match = CONTENT_RANGE_TOTAL.search(response.headers.get('content-range', ''))
+    return int(match.group(1)) if match else None
+
+
+def pace(scheduler: Optional[HostScheduler], url: str):
+    """Wait for the host's next request slot, when the caller paces its requests"""
+    if scheduler:
+        scheduler.wait(url)
+
+
+def _drain(response: requests.Response):
+    """Read a small body to the end so its keep-alive connection goes back to the pool"""
+    response.raw.read()
+
+
+def _first_byte(client: HttpClient, url: str, headers: dict, timeout: float,
+                allow_redirects: bool = True, scheduler: Optional[HostScheduler] = None) -> requests.Response:
+    """GET with Range: bytes=0-0; the body (one byte if the range is honored) is read so the connection is reused"""
+    pace(scheduler, url)
+    response = client.get(url, headers=dict(headers, Range='bytes=0-0'), timeout=timeout,
+                          allow_redirects=allow_redirects, stream=True)
+    if response.status_code == 416:
+        # Empty resource: nothing to range over, ask for it plainly
+        response.close()
+        pace(scheduler, url)
+        response = client.get(url, headers=headers, timeout=timeout, allow_redirects=allow_redirects, stream=True)
+    if response.status_code != 200:
+        _drain(response)
+    response.close()
+    return response
+
+
+def head(client: HttpClient, url: str, headers: dict, timeout: float,
+         allow_redirects: bool = False, scheduler: Optional[HostScheduler] = None) -> requests.Response:
+    """
+    HEAD the URL. Servers that reject HEAD get a one-byte ranged GET instead;
+    callers should treat its 206 like a 200 (content_range_total gives the size).
+    With a scheduler, every request sent waits for the host's slot.
+    """
+    pace(scheduler, url)
+    response = client.head(url, headers=headers, timeout=timeout, allow_redirects=allow_redirects)
+    if response.status_code in HEAD_REJECTED_STATUSES:
+        return _first_byte(client, url, headers, timeout, allow_redirects, scheduler)
+    return response
+
+
+def probe_size(client: HttpClient, url: str, headers: dict, timeout: float,
+               max_bytes: int = CrawlerConfig.SIZE_PROBE_MAX_BYTES,
+               scheduler: Optional[HostScheduler] = None) -> Optional[Tuple[int, bool]]:
+    """
+    Size in bytes of a resource whose HEAD had no Content-Length (chunked
+    responses, many CDNs). Asks for the first byte to read the total from
+    Content-Range; if the server ignores Range, counts the streamed body up to
+    `max_bytes`. Returns (size, exact), exact=False meaning "at least size",
+    or None if nothing could be read.
+    """
+    pace(scheduler, url)
+    response = client.get(url, headers=dict(headers, Range='bytes=0-0'), timeout=timeout, stream=True)
+    with response:
+        if response.status_code == 206:
+            total = content_range_total(response)
+            _drain(response)
+            if total is not None:
+                return total, True
+            return None
+
+        if response.status_code != 200:
+            return None
+
+        content_length = response.headers.get('content-length')
+        if content_length:
+            return int(content_length), True
+
+        # Count what goes over the wire (Content-Length semantics), without decoding
+        size = 0
+        for chunk in response.raw.stream(64 * 1024, decode_content=False):
+            size += len(chunk)
+            if size >= max_bytes:
+                return size, False
+        return size, True
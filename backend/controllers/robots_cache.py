@@ -0,0 +1,151 @@
+import math
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+from config.crawler_config import CrawlerConfig
+from controllers.http_client import HttpClient, http_client
+from controllers.host_scheduler import HostScheduler
+from controllers.resource_probe import pace
+
+# Hosts whose robots.txt could not be fetched are retried sooner
+ERROR_TTL_SECONDS = 5 * 60
+
+
+def parse_crawl_delays(lines: List[str]) -> Dict[str, float]:
+    """
+    Crawl-delay per user-agent token (lowercased, '*' included) from robots.txt lines.
+    RobotFileParser only accepts whole seconds and drops values like 0.5;
+    here any non-negative number is kept. The first delay in a group wins.
+    """
+    delays: Dict[str, float] = {}
+    agents: List[str] = []
+    in_rules = False
+    for line in lines:
+        line = line.split('#', 1)[0].strip()
+        if ':' not in line:
+            continue
+        field, value = (part.strip() for part in line.split(':', 1))
+        field = field.lower()
+
+        if field == 'user-agent':
+            # A user-agent line after rules starts a new group
+            if in_rules:
+                agents, in_rules = [], False
+            agents.append(value.lower())
+            continue
+
+        in_rules = True
+        if field != 'crawl-delay':
+            continue
+        try:
+            delay = float(value)
+        except ValueError:
+            continue
+        if math.isfinite(delay) and delay >= 0:
+            for agent in agents:
+                delays.setdefault(agent, delay)
+    return delays
+
+
+class RobotsRules:
+    """Parsed robots.txt of one host"""
+
+    def __init__(self, parser: RobotFileParser, user_agent: str,
+                 crawl_delays: Optional[Dict[str, float]] = None):
+        self.parser = parser
+        self.user_agent = user_agent
+        self.crawl_delays = crawl_delays or {}
+
+    @property
+    def crawl_delay(self) -> Optional[float]:
+        """Crawl-delay of the group matching our user agent (same matching as RobotFileParser), else of '*'"""
+        token = self.user_agent.split('/')[0].lower()
+        for agent, delay in self.crawl_delays.items():
+            if agent != '*' and agent in token:
+                return delay
+        return self.crawl_delays.get('*')
+
+    @property
+    def sitemaps(self) -> List[str]:
+        return self.parser.site_maps() or []
+
+    def can_fetch(self, url: str) -> bool:
+        return self.parser.can_fetch(self.user_agent, url)
+
+
+class RobotsCache:
+    """
+    robots.txt rules per host, fetched once and reused until `ttl_seconds` pass.
+    A missing robots.txt (4xx) allows everything. So does an unreachable one,
+    but it is only remembered for ERROR_TTL_SECONDS.
+    """
+
+    def __init__(self, ttl_seconds: int = CrawlerConfig.ROBOTS_TTL_SECONDS,
+                 user_agent: str = CrawlerConfig.ROBOTS_USER_AGENT):
+        self.ttl_seconds = ttl_seconds
+        self.user_agent = user_agent
+        self._rules: Dict[str, Tuple[float, RobotsRules]] = {}
+        self._host_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _robots_url(url: str) -> Tuple[str, str]:
+        parsed = urlparse(url)
+        return parsed.netloc, f"{parsed.scheme}://{parsed.netloc}/robots.txt"
+
+    def _fetch(self, robots_url: str, client: HttpClient,
+               scheduler: Optional[HostScheduler] = None) -> Tuple[RobotsRules, int]:
+        parser = RobotFileParser(robots_url)
+        try:
+            pace(scheduler, robots_url)
+            headers = {
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            }
+            response = client.get(robots_url, headers=headers, timeout=10)
+            if response.status_code >= 400:
+                parser.allow_all = True
+                ttl = self.ttl_seconds if response.status_code < 500 else ERROR_TTL_SECONDS
+                return RobotsRules(parser, self.user_agent), ttl
+            lines = response.text.splitlines()
+            parser.parse(lines)
+            return RobotsRules(parser, self.user_agent, parse_crawl_delays(lines)), self.ttl_seconds
+        except Exception as e:
+            print(f"robots.txt fetch failed for {robots_url}: {str(e)}")
+            parser.allow_all = True
+            return RobotsRules(parser, self.user_agent), ERROR_TTL_SECONDS
+
+    def get(self, url: str, client: Optional[HttpClient] = None,
+            scheduler: Optional[HostScheduler] = None) -> RobotsRules:
+        """Rules for the URL's host, fetching robots.txt (paced by `scheduler`, if given) if not cached or expired"""
+        host, robots_url = self._robots_url(url)
+
+        with self._lock:
+            cached = self._rules.get(host)
+            if cached and cached[0] > time.monotonic():
+                return cached[1]
+            host_lock = self._host_locks.setdefault(host, threading.Lock())
+
+        # One fetch per host; other threads wait for it rather than fetching again
+        with host_lock:
+            with self._lock:
+                cached = self._rules.get(host)
+                if cached and cached[0] > time.monotonic():
+                    return cached[1]
+
+            rules, ttl = self._fetch(robots_url, client or http_client, scheduler)
+            with self._lock:
+                self._rules[host] = (time.monotonic() + ttl, rules)
+            return rules
+
+    def can_fetch(self, url: str, client: Optional[HttpClient] = None,
+                  scheduler: Optional[HostScheduler] = None) -> bool:
+        return self.get(url, client, scheduler).can_fetch(url)
+
+    def clear(self):
+        with self._lock:
+            self._rules.clear()
+
+
+robots_cache = RobotsCache()
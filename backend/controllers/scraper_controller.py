@@ -3,12 +3,13 @@ from fastapi import HTTPException
 from models.website import Website, WebPage, WebsiteRead
 from models.user import User
 import requests
-from bs4 import BeautifulSoup
+from controllers.page_facts import extract_page_facts
+from controllers.http_client import HttpClient, http_client
 import time
 
 class ScraperController:
     @staticmethod
-    def scrape_website(url: str, session: Session, current_user: User) -> WebsiteRead:
+    def scrape_website(url: str, session: Session, current_user: User, client: HttpClient = None) -> WebsiteRead:
         try:
             if not url.startswith(('http://', 'https://')):
                 url = 'https://' + url
@@ -18,24 +19,14 @@ class ScraperController:
             }
             
             start_time = time.time()
-            response = requests.get(url, headers=headers, timeout=10)
+            response = (client or http_client).get(url, headers=headers, timeout=10)
             load_time = time.time() - start_time
             
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            title = soup.title.string if soup.title else "No title found"
-            
-            for element in soup(["script", "style", "nav", "header", "footer", "aside"]):
-                element.decompose()
-            
-            text_content = soup.get_text()
-            lines = (line.strip() for line in text_content.splitlines())
-            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-            clean_content = ' '.join(chunk for chunk in chunks if chunk)
-            
-            if len(clean_content) > 10000:
-                clean_content = clean_content[:10000] + "... [content truncated]"
+            facts = extract_page_facts(response.content)
+            title = facts.title
+            clean_content = facts.content
             
             word_count = len(clean_content.split())
             
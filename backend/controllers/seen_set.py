@@ -0,0 +1,92 @@
+import hashlib
+import math
+from array import array
+
+EMPTY = 0
+MAX_LOAD_FACTOR = 0.7
+
+
+def fingerprint_bits_for(expected_items: int, false_positive_rate: float) -> int:
+    """
+    Fingerprint width that keeps the chance of a new URL colliding with one of
+    `expected_items` stored fingerprints at or below `false_positive_rate`.
+    """
+    needed = math.log2(max(expected_items, 1) / false_positive_rate)
+    return 32 if needed <= 32 else 64
+
+
+class CompactSeenSet:
+    """
+    Set of URLs stored as 32- or 64-bit fingerprints in a flat array
+    (open addressing, linear probing) instead of full strings: about 6-12
+    bytes per URL with 32-bit fingerprints, 12-24 with 64-bit, against 100+
+    for a set of strings.
+
+    Membership is probabilistic in one direction only: a URL that was added is
+    always found, but a new URL may collide with a stored fingerprint and look
+    seen, so the crawler would skip it. The fingerprint width is picked from
+    `false_positive_rate` at `expected_items`; the rate grows past that size.
+    URLs cannot be listed back out. Single writer; lookups from other threads are safe.
+    """
+
+    def __init__(self, expected_items: int = 1_000_000, false_positive_rate: float = 1e-9,
+                 initial_capacity: int = 1024):
+        self.fingerprint_bits = fingerprint_bits_for(expected_items, false_positive_rate)
+        if self.fingerprint_bits == 32 and array('I').itemsize != 4:
+            self.fingerprint_bits = 64
+        self._typecode = 'I' if self.fingerprint_bits == 32 else 'Q'
+        self._digest_size = self.fingerprint_bits // 8
+        self._initial_capacity = 1 << max(initial_capacity - 1, 1).bit_length()
+        self._count = 0
+        self._table = array(self._typecode, bytes(self._initial_capacity * array(self._typecode).itemsize))
+
+    def _fingerprint(self, url: str) -> int:
+        digest = hashlib.blake2b(url.encode('utf-8'), digest_size=self._digest_size).digest()
+        return int.from_bytes(digest, 'little') or 1
+
+    @staticmethod
+    def _find(table: array, fingerprint: int) -> int:
+        """Index holding the fingerprint, or the empty slot where it belongs"""
+        mask = len(table) - 1
+        index = fingerprint & mask
+        while True:
+            value = table[index]
+            if value == fingerprint or value == EMPTY:
+                return index
+            index = (index + 1) & mask
+
+    def _grow(self):
+        table = array(self._typecode, bytes(len(self._table) * 2 * self._table.itemsize))
+        for fingerprint in self._table:
+            if fingerprint != EMPTY:
+                table[self._find(table, fingerprint)] = fingerprint
+        self._table = table
+
+    def add(self, url: str) -> bool:
+        """Add the URL. Returns False if it (or a colliding fingerprint) was already present."""
+        fingerprint = self._fingerprint(url)
+        index = self._find(self._table, fingerprint)
+        if self._table[index] == fingerprint:
+            return False
+
+        self._table[index] = fingerprint
+        self._count += 1
+        if self._count > len(self._table) * MAX_LOAD_FACTOR:
+            self._grow()
+        return True
+
+    def clear(self):
+        self._count = 0
+        self._table = array(self._typecode, bytes(self._initial_capacity * self._table.itemsize))
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._table) * self._table.itemsize
+
+    def __contains__(self, url: str) -> bool:
+        table = self._table
+        fingerprint = self._fingerprint(url)
+        return table[self._find(table, fingerprint)] == fingerprint
+
+    def __len__(self) -> int:
+        return self._count
@@ -1,50 +1,224 @@
+import gzip
+import io
+import queue
+import threading
 import requests
-from urllib.parse import urljoin, urlparse
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin
 from xml.etree import ElementTree
-from typing import List
+from typing import Dict, Iterator, List, Optional
+from config.crawler_config import CrawlerConfig
+from controllers.http_client import HttpClient, http_client
+from controllers.host_scheduler import HostScheduler
+from controllers.resource_probe import pace
+from controllers.robots_cache import RobotsCache, robots_cache
+
+GZIP_MAGIC = b'\x1f\x8b'
+UTF8_BOM = b'\xef\xbb\xbf'
+
+# Probed when robots.txt does not list every sitemap
+COMMON_SITEMAP_LOCATIONS = [
+    '/sitemap.xml',
+    '/sitemap_index.xml',
+    '/sitemap.php',
+    '/sitemap.txt'
+]
+
+
+def _local_name(tag: str) -> str:
+    """Tag name without its XML namespace"""
+    return tag.rsplit('}', 1)[-1]
+
 
 class SitemapParser:
+    """
+    Sitemap discovery and streaming. Pass the crawler's HostScheduler as
+    `scheduler` and every request waits for the host's slot (Crawl-delay included).
+    """
+
     @staticmethod
-    def parse_sitemap(sitemap_url: str) -> List[str]:
-        try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            response = requests.get(sitemap_url, headers=headers, timeout=10)
+    def _open_stream(response: requests.Response):
+        """File-like body of a streamed response, gunzipped if the sitemap itself is a .gz file"""
+        # Content-Encoding: gzip is undone by urllib3; a .xml.gz file still starts with the gzip magic
+        response.raw.decode_content = True
+        # Keep urllib3 from closing the body at EOF underneath the buffered reader
+        response.raw.auto_close = False
+        stream = io.BufferedReader(response.raw)
+        if stream.peek(2)[:2] == GZIP_MAGIC:
+            return gzip.GzipFile(fileobj=stream)
+        return stream
+
+    @staticmethod
+    def _read_entries(sitemap_url: str, client: HttpClient, stop: threading.Event,
+                      scheduler: Optional[HostScheduler] = None) -> Iterator[Dict]:
+        """
+        Stream one sitemap document. Yields {'loc', 'lastmod', 'priority'} per <url>
+        and {'sitemap': loc} per <sitemap> of an index. Parsed elements are dropped
+        as we go, so memory stays flat however large the file is.
+        Plain-text sitemaps (one URL per line) are read line by line.
+        """
+        headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        }
+        pace(scheduler, sitemap_url)
+        with client.get(sitemap_url, headers=headers, timeout=10, stream=True) as response:
             response.raise_for_status()
-            
-            urls = []
-            root = ElementTree.fromstring(response.content)
-            
-            namespaces = {'ns': 'http://www.sitemaps.org/schemas/sitemap/0.9'}
-            
-            for url_elem in root.findall('ns:url', namespaces):
-                loc_elem = url_elem.find('ns:loc', namespaces)
-                if loc_elem is not None and loc_elem.text:
-                    urls.append(loc_elem.text.strip())
-            
-            return urls
-            
+            stream = SitemapParser._open_stream(response)
+
+            head = stream.peek(64)
+            # Many XML sitemaps start with a byte order mark; expat handles it, the sniffing must too
+            if head.startswith(UTF8_BOM):
+                head = head[len(UTF8_BOM):]
+            if not head.lstrip().startswith(b'<'):
+                for line in io.TextIOWrapper(stream, encoding='utf-8-sig', errors='replace'):
+                    if stop.is_set():
+                        return
+                    line = line.strip()
+                    if line.startswith(('http://', 'https://')):
+                        yield {'loc': line, 'lastmod': None, 'priority': None}
+                return
+
+            root = None
+            for event, elem in ElementTree.iterparse(stream, events=('start', 'end')):
+                if root is None:
+                    root = elem
+                if stop.is_set():
+                    return
+                if event != 'end':
+                    continue
+
+                name = _local_name(elem.tag)
+                if name not in ('url', 'sitemap'):
+                    continue
+
+                fields = {_local_name(child.tag): (child.text or '').strip() for child in elem}
+                root.clear()
+                loc = fields.get('loc')
+                if not loc:
+                    continue
+
+                if name == 'sitemap':
+                    yield {'sitemap': urljoin(sitemap_url, loc)}
+                else:
+                    priority = fields.get('priority')
+                    try:
+                        priority = float(priority) if priority else None
+                    except ValueError:
+                        priority = None
+                    yield {'loc': loc, 'lastmod': fields.get('lastmod') or None, 'priority': priority}
+
+    @staticmethod
+    def iter_sitemap(sitemap_url: str, client: Optional[HttpClient] = None,
+                     max_depth: int = CrawlerConfig.SITEMAP_MAX_DEPTH,
+                     max_urls: int = CrawlerConfig.SITEMAP_MAX_URLS,
+                     workers: int = CrawlerConfig.SITEMAP_WORKERS,
+                     scheduler: Optional[HostScheduler] = None) -> Iterator[Dict]:
+        """
+        Lazily yield {'loc', 'lastmod', 'priority'} for every page in a sitemap,
+        following sitemap indexes up to `max_depth` levels. Child sitemaps are
+        fetched on `workers` threads into a bounded buffer, and everything stops
+        after `max_urls` entries or when the caller stops iterating.
+        """
+        client = client or http_client
+        entries: queue.Queue = queue.Queue(maxsize=CrawlerConfig.SITEMAP_QUEUE_SIZE)
+        stop = threading.Event()
+
+        def put(message):
+            # Blocks while the buffer is full, unless the consumer has gone away
+            while not stop.is_set():
+                try:
+                    entries.put(message, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def read(url: str, depth: int):
+            try:
+                for entry in SitemapParser._read_entries(url, client, stop, scheduler):
+                    if 'sitemap' in entry:
+                        put(('sitemap', entry['sitemap'], depth + 1))
+                    else:
+                        put(('url', entry, depth))
+            except Exception as e:
+                print(f"Sitemap parsing failed for {url}: {str(e)}")
+            finally:
+                put(('done', url, depth))
+
+        seen_sitemaps = {sitemap_url}
+        outstanding = 1
+        yielded = 0
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            executor.submit(read, sitemap_url, 0)
+            while outstanding and yielded < max_urls:
+                kind, value, depth = entries.get()
+                if kind == 'done':
+                    outstanding -= 1
+                elif kind == 'sitemap':
+                    if depth > max_depth:
+                        print(f"Sitemap index nested too deep, skipping: {value}")
+                    elif value not in seen_sitemaps:
+                        seen_sitemaps.add(value)
+                        outstanding += 1
+                        executor.submit(read, value, depth)
+                else:
+                    yielded += 1
+                    yield value
+        finally:
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def parse_sitemap(sitemap_url: str, client: Optional[HttpClient] = None,
+                      scheduler: Optional[HostScheduler] = None) -> List[str]:
+        """All page URLs of a sitemap (and any sitemaps it indexes), up to SITEMAP_MAX_URLS"""
+        try:
+            return [entry['loc'] for entry in SitemapParser.iter_sitemap(sitemap_url, client, scheduler=scheduler)]
         except Exception as e:
             print(f"Sitemap parsing failed: {str(e)}")
             return []
 
     @staticmethod
-    def find_sitemap_url(base_url: str) -> str:
-        common_locations = [
-            '/sitemap.xml',
-            '/sitemap_index.xml',
-            '/sitemap.php',
-            '/sitemap.txt'
-        ]
-        
-        for location in common_locations:
-            sitemap_url = urljoin(base_url, location)
-            try:
-                response = requests.head(sitemap_url, timeout=5)
-                if response.status_code == 200:
-                    return sitemap_url
-            except:
-                continue
-                
-        return None
\ No newline at end of file
+    def _probe(sitemap_url: str, client: HttpClient, scheduler: Optional[HostScheduler] = None) -> bool:
+        """Whether the URL answers 200. Falls back to a GET when the server rejects HEAD."""
+        try:
+            pace(scheduler, sitemap_url)
+            response = client.head(sitemap_url, timeout=5, allow_redirects=True)
+            if response.status_code in (403, 405, 501):
+                pace(scheduler, sitemap_url)
+                with client.get(sitemap_url, timeout=5, stream=True) as response:
+                    return response.status_code == 200
+            return response.status_code == 200
+        except Exception:
+            return False
+
+    @staticmethod
+    def find_sitemap_urls(base_url: str, client: Optional[HttpClient] = None,
+                          scheduler: Optional[HostScheduler] = None,
+                          robots: Optional[RobotsCache] = None) -> List[str]:
+        """
+        Every sitemap of the site: the Sitemap: lines of robots.txt first, then
+        whichever common locations exist. robots.txt and all probes are fetched
+        at the same time, so without a scheduler discovery takes about one round
+        trip; with one they go out one host slot apart.
+        """
+        client = client or http_client
+        robots = robots or robots_cache
+        candidates = [urljoin(base_url, location) for location in COMMON_SITEMAP_LOCATIONS]
+
+        with ThreadPoolExecutor(max_workers=len(candidates) + 1) as executor:
+            robots_rules = executor.submit(robots.get, base_url, client, scheduler)
+            probes = [executor.submit(SitemapParser._probe, url, client, scheduler) for url in candidates]
+
+            sitemap_urls = list(dict.fromkeys(robots_rules.result().sitemaps))
+            for url, probe in zip(candidates, probes):
+                if url not in sitemap_urls and probe.result():
+                    sitemap_urls.append(url)
+
+        return sitemap_urls
+
+    @staticmethod
+    def find_sitemap_url(base_url: str, client: Optional[HttpClient] = None,
+                         scheduler: Optional[HostScheduler] = None) -> Optional[str]:
+        sitemap_urls = SitemapParser.find_sitemap_urls(base_url, client, scheduler)
+        return sitemap_urls[0] if sitemap_urls else None
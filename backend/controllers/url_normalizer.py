@@ -0,0 +1,99 @@
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse
+from config.crawler_config import CrawlerConfig
+
+# hrefs that never lead to a crawlable page
+SKIPPED_HREF_PREFIXES = ('javascript:', 'mailto:', 'tel:', '#')
+# Linked files we do not crawl; matched anywhere in the URL, case-insensitively
+SKIPPED_EXTENSIONS = re.compile(r'\.(?:pdf|jpg|png|docx?|zip)', re.IGNORECASE)
+_HAS_SCHEME = re.compile(r'^[a-zA-Z][a-zA-Z0-9+.-]*:')
+
+
+@lru_cache(maxsize=CrawlerConfig.URL_CACHE_SIZE)
+def normalize_url(url: str) -> str:
+    """Canonical form used for crawl dedupe and cache keys: no fragment, sorted query, no trailing slash"""
+    try:
+        parsed = urlparse(url)
+        if not parsed.scheme:
+            url = 'https://' + url
+            parsed = urlparse(url)
+
+        normalized = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+        if parsed.query:
+            params = sorted(parsed.query.split('&'))
+            normalized += '?' + '&'.join(params)
+        return normalized.rstrip('/')
+    except Exception as e:
+        print(f"URL normalization failed for {url}: {str(e)}")
+        return url
+
+
+def _join_key(base_url: str, href: str) -> str:
+    """
+    The part of the base URL the href's resolution depends on, so nav links
+    shared by every page hit the cache: nothing for absolute hrefs, the scheme
+    for protocol-relative ones, the origin for root-relative ones, the full base otherwise.
+    """
+    if _HAS_SCHEME.match(href):
+        return ''
+    if href.startswith('/'):
+        scheme, netloc = _origin(base_url)
+        if href.startswith('//'):
+            return f"{scheme}:"
+        return f"{scheme}://{netloc}/"
+    return base_url
+
+
+@lru_cache(maxsize=1024)
+def _origin(base_url: str) -> Tuple[str, str]:
+    parsed = urlparse(base_url)
+    return parsed.scheme, parsed.netloc
+
+
+@lru_cache(maxsize=CrawlerConfig.URL_CACHE_SIZE)
+def _resolve(base_key: str, href: str) -> Optional[Tuple[str, str]]:
+    """(normalized URL, host) for a crawlable href, or None if the skip rules drop it"""
+    try:
+        full_url = urljoin(base_key, href) if base_key else href
+        if SKIPPED_EXTENSIONS.search(full_url):
+            return None
+        return normalize_url(full_url), urlparse(full_url).netloc
+    except ValueError as e:
+        print(f"Error processing link {href}: {str(e)}")
+        return None
+
+
+def resolve_link(base_url: str, href: str) -> Optional[Tuple[str, str]]:
+    """Resolve one href found on base_url. Returns (normalized URL, host), or None if it is not crawlable."""
+    if not href or href.startswith(SKIPPED_HREF_PREFIXES):
+        return None
+    return _resolve(_join_key(base_url, href), href)
+
+
+def normalize_links(base_url: str, hrefs: Iterable[str], domain: Optional[str] = None) -> List[str]:
+    """
+    Normalize all hrefs of one page at once: duplicates are resolved once, the
+    skip rules apply, and with `domain` set only links on that host are kept.
+    Returns unique normalized URLs in document order.
+    """
+    links: Dict[str, None] = {}
+    for href in dict.fromkeys(hrefs):
+        resolved = resolve_link(base_url, href)
+        if resolved and (domain is None or resolved[1] == domain):
+            links[resolved[0]] = None
+    return list(links)
+
+
+def cache_stats() -> Dict:
+    normalized = normalize_url.cache_info()
+    resolved = _resolve.cache_info()
+    return {
+        'normalize_hits': normalized.hits,
+        'normalize_misses': normalized.misses,
+        'resolve_hits': resolved.hits,
+        'resolve_misses': resolved.misses,
+        'resolve_entries': resolved.currsize,
+        'max_entries': resolved.maxsize
+    }
@@ -0,0 +1,188 @@
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Optional
+from config.crawler_config import CrawlerConfig
+
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+
+
+class WorkQueue(ABC):
+    """
+    What the distributed crawler needs from a shared work queue. Every URL
+    pushed is remembered (the shared seen-set), workers lease URLs, then ack
+    or release them. A lease that is neither acked nor released expires and
+    the URL goes back to pending, so a crashed worker loses nothing; a URL
+    leased max_attempts times without an ack is marked failed.
+    SQLiteWorkQueue implements this locally; a network broker can implement
+    the same methods later.
+    """
+
+    @abstractmethod
+    def push(self, urls: Iterable[str]) -> int:
+        """Queue URLs not seen before in this crawl. Returns how many were new."""
+
+    @abstractmethod
+    def lease(self, worker_id: str, limit: int = 1) -> List[str]:
+        """Up to `limit` pending URLs, leased to the worker"""
+
+    @abstractmethod
+    def ack(self, url: str):
+        """Mark a leased URL done"""
+
+    @abstractmethod
+    def release(self, url: str):
+        """Give a leased URL back after a failure"""
+
+    @abstractmethod
+    def is_finished(self) -> bool:
+        """Whether the crawl has nothing left to lease or reached its page budget"""
+
+    @abstractmethod
+    def counts(self) -> Dict[str, int]:
+        """URLs per state"""
+
+    @abstractmethod
+    def close(self):
+        """Release the queue's connection"""
+
+
+class SQLiteWorkQueue(WorkQueue):
+    """
+    Work queue in a SQLite file in WAL mode, shared by worker processes on one
+    machine. Leasing runs in a write transaction, so two workers never get the
+    same URL. The crawl's page budget (max_pages) counts leased + finished URLs.
+    """
+
+    def __init__(self, path: str, crawl_id: int,
+                 lease_seconds: float = CrawlerConfig.QUEUE_LEASE_SECONDS,
+                 max_attempts: int = CrawlerConfig.QUEUE_MAX_ATTEMPTS):
+        self.path = path
+        self.crawl_id = crawl_id
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.connection = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self._create_tables()
+
+        meta = self.connection.execute(
+            "SELECT base_url, max_pages FROM crawl WHERE id = ?", (crawl_id,)
+        ).fetchone()
+        self.base_url: Optional[str] = meta[0] if meta else None
+        self.max_pages: Optional[int] = meta[1] if meta else None
+
+    def _create_tables(self):
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS crawl (
+                id INTEGER PRIMARY KEY,
+                base_url TEXT NOT NULL,
+                max_pages INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS crawl_queue (
+                crawl_id INTEGER NOT NULL,
+                url TEXT NOT NULL,
+                state TEXT NOT NULL,
+                worker TEXT,
+                lease_until REAL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (crawl_id, url)
+            );
+            CREATE INDEX IF NOT EXISTS ix_crawl_queue_state ON crawl_queue (crawl_id, state);
+        """)
+
+    @classmethod
+    def create(cls, path: str, crawl_id: int, base_url: str, max_pages: int) -> "SQLiteWorkQueue":
+        queue = cls(path, crawl_id)
+        queue.connection.execute(
+            "INSERT OR REPLACE INTO crawl (id, base_url, max_pages) VALUES (?, ?, ?)",
+            (crawl_id, base_url, max_pages)
+        )
+        queue.base_url = base_url
+        queue.max_pages = max_pages
+        return queue
+
+    def push(self, urls: Iterable[str]) -> int:
+        rows = [(self.crawl_id, url, PENDING) for url in urls]
+        if not rows:
+            return 0
+        before = self.connection.total_changes
+        self.connection.execute("BEGIN IMMEDIATE")
+        try:
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO crawl_queue (crawl_id, url, state) VALUES (?, ?, ?)", rows
+            )
+            self.connection.execute("COMMIT")
+        except Exception:
+            self.connection.execute("ROLLBACK")
+            raise
+        return self.connection.total_changes - before
+
+    def lease(self, worker_id: str, limit: int = 1) -> List[str]:
+        now = time.time()
+        self.connection.execute("BEGIN IMMEDIATE")
+        try:
+            # Reclaim leases from workers that died or stalled; a URL that keeps killing or
+            # stalling its workers is failed after max_attempts instead of handed out forever
+            self.connection.execute(
+                "UPDATE crawl_queue SET state = CASE WHEN attempts >= ? THEN ? ELSE ? END, "
+                "worker = NULL, lease_until = NULL "
+                "WHERE crawl_id = ? AND state = ? AND lease_until < ?",
+                (self.max_attempts, FAILED, PENDING, self.crawl_id, LEASED, now)
+            )
+            claimed = self.connection.execute(
+                "SELECT COUNT(*) FROM crawl_queue WHERE crawl_id = ? AND state IN (?, ?, ?)",
+                (self.crawl_id, LEASED, DONE, FAILED)
+            ).fetchone()[0]
+            budget = min(limit, self.max_pages - claimed)
+            if budget <= 0:
+                self.connection.execute("COMMIT")
+                return []
+
+            urls = [row[0] for row in self.connection.execute(
+                "SELECT url FROM crawl_queue WHERE crawl_id = ? AND state = ? ORDER BY rowid LIMIT ?",
+                (self.crawl_id, PENDING, budget)
+            )]
+            self.connection.executemany(
+                "UPDATE crawl_queue SET state = ?, worker = ?, lease_until = ?, attempts = attempts + 1 "
+                "WHERE crawl_id = ? AND url = ?",
+                [(LEASED, worker_id, now + self.lease_seconds, self.crawl_id, url) for url in urls]
+            )
+            self.connection.execute("COMMIT")
+            return urls
+        except Exception:
+            self.connection.execute("ROLLBACK")
+            raise
+
+    def ack(self, url: str):
+        self.connection.execute(
+            "UPDATE crawl_queue SET state = ?, lease_until = NULL WHERE crawl_id = ? AND url = ?",
+            (DONE, self.crawl_id, url)
+        )
+
+    def release(self, url: str):
+        """Give a URL back after a failure; it is dropped after max_attempts leases"""
+        self.connection.execute(
+            "UPDATE crawl_queue SET state = CASE WHEN attempts >= ? THEN ? ELSE ? END, "
+            "worker = NULL, lease_until = NULL WHERE crawl_id = ? AND url = ?",
+            (self.max_attempts, FAILED, PENDING, self.crawl_id, url)
+        )
+
+    def counts(self) -> Dict[str, int]:
+        counts = {PENDING: 0, LEASED: 0, DONE: 0, FAILED: 0}
+        for state, count in self.connection.execute(
+            "SELECT state, COUNT(*) FROM crawl_queue WHERE crawl_id = ? GROUP BY state", (self.crawl_id,)
+        ):
+            counts[state] = count
+        return counts
+
+    def is_finished(self) -> bool:
+        counts = self.counts()
+        if counts[DONE] + counts[FAILED] >= self.max_pages:
+            return True
+        return counts[PENDING] == 0 and counts[LEASED] == 0
+
+    def close(self):
+        self.connection.close()
@@ -10,6 +10,9 @@ from routes.export_routes import router as export_router
 from routes.health_routes import router as health_router
 from routes.dashboard_routes import router as dashboard_router
 from routes.issues_routes import router as issues_router 
+from routes.admin_routes import router as admin_router
+from controllers.http_client import http_client
+from controllers.crawl_jobs import crawl_job_runner
 
 create_db_and_tables()
 
@@ -32,6 +35,16 @@ app.include_router(export_router)
 app.include_router(health_router)
 app.include_router(dashboard_router)
 app.include_router(issues_router)
+app.include_router(admin_router)
+
+@app.on_event("startup")
+def resume_crawl_jobs():
+    crawl_job_runner.recover()
+
+@app.on_event("shutdown")
+def shutdown_background_work():
+    crawl_job_runner.shutdown()
+    http_client.close()
 
 @app.get("/")
 def read_root():
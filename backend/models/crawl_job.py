@@ -0,0 +1,38 @@
+from sqlmodel import SQLModel, Field
+from typing import Optional
+from datetime import datetime
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+
+class CrawlJob(SQLModel, table=True):
+    id: Optional[int] = Field(default=None, primary_key=True)
+    user_id: int = Field(foreign_key="user.id", index=True)
+    status: str = Field(default=JOB_QUEUED, index=True)
+    base_url: str
+    request_data: str
+    website_id: Optional[int] = Field(default=None, foreign_key="website.id")
+    page_count: Optional[int] = Field(default=None)
+    error: Optional[str] = Field(default=None)
+    # JSON: per-host request stats of the finished crawl
+    metrics_data: Optional[str] = Field(default=None)
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    started_at: Optional[datetime] = Field(default=None)
+    finished_at: Optional[datetime] = Field(default=None)
+    # Runner that claimed the job, and when that runner last reported itself alive
+    worker_id: Optional[str] = Field(default=None)
+    heartbeat_at: Optional[datetime] = Field(default=None)
+
+class CrawlJobRead(SQLModel):
+    id: int
+    status: str
+    base_url: str
+    website_id: Optional[int]
+    page_count: Optional[int]
+    error: Optional[str]
+    metrics_data: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
@@ -0,0 +1,14 @@
+from sqlmodel import SQLModel, Field
+from typing import Optional
+from datetime import datetime
+
+class ImageMetadata(SQLModel, table=True):
+    url: str = Field(primary_key=True)
+    etag: str
+    content_length: Optional[int] = Field(default=None)
+    content_type: Optional[str] = Field(default=None)
+    width: int
+    height: int
+    aspect_ratio: float
+    is_banner: bool = Field(default=False)
+    checked_at: datetime = Field(default_factory=datetime.utcnow)
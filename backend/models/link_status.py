@@ -0,0 +1,21 @@
+from sqlmodel import SQLModel, Field
+from typing import Optional
+from datetime import datetime
+
+class LinkStatus(SQLModel, table=True):
+    url: str = Field(primary_key=True)
+    status_code: int
+    final_url: Optional[str] = Field(default=None)
+    redirected: bool = Field(default=False)
+    error: Optional[str] = Field(default=None)
+    checked_at: datetime = Field(default_factory=datetime.utcnow, index=True)
+
+class LinkStatusCacheStats(SQLModel):
+    entries: int
+    hits: int
+    misses: int
+    expired: int
+    writes: int
+    hit_rate: float
+    ttl_seconds: int
+    negative_ttl_seconds: int
@@ -1,6 +1,8 @@
 from sqlmodel import SQLModel, Field, Relationship
-from typing import Optional, List
+from pydantic import NonNegativeInt
+from typing import Optional, List, Literal, Dict
 from datetime import datetime
+from config.crawler_config import CrawlerConfig
 
 class WebPage(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
@@ -18,6 +20,11 @@ class WebPage(SQLModel, table=True):
     
     broken_links_data: Optional[str] = Field(default=None)
     large_images_data: Optional[str] = Field(default=None)
+    
+    # Validators for incremental re-crawls
+    etag: Optional[str] = Field(default=None)
+    last_modified: Optional[str] = Field(default=None)
+    content_hash: Optional[str] = Field(default=None)
    
     website: Optional["Website"] = Relationship(back_populates="pages")
 
@@ -33,6 +40,15 @@ class Website(SQLModel, table=True):
 class WebsiteCreate(SQLModel):
     base_url: str
     max_pages: int = Field(default=50, ge=1, le=1000)
+    engine: Literal["sync", "async"] = Field(default=CrawlerConfig.DEFAULT_ENGINE)
+    max_concurrency: int = Field(default=CrawlerConfig.MAX_CONCURRENCY, ge=1, le=64)
+    per_host_concurrency: int = Field(default=CrawlerConfig.PER_HOST_CONCURRENCY, ge=1, le=16)
+    # Re-crawl: send conditional requests and carry unchanged pages forward from the last crawl
+    incremental: bool = False
+    # Link hops from base_url beyond which pages are not crawled (sitemap pages count as one hop)
+    max_depth: Optional[int] = Field(default=None, ge=0, le=100)
+    # Most pages crawled under a path prefix, e.g. {"/tag/": 20, "/page/": 10}
+    path_budgets: Dict[str, NonNegativeInt] = Field(default_factory=dict)
 
 class WebsiteRead(SQLModel):
     id: int
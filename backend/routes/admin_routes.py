@@ -0,0 +1,20 @@
+from fastapi import APIRouter, Depends
+from config.dependencies import get_current_active_user
+from models.user import User
+from models.link_status import LinkStatusCacheStats
+from controllers.link_status_store import link_status_store
+from controllers.http_client import http_client
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+@router.get("/link-status-cache", response_model=LinkStatusCacheStats)
+def get_link_status_cache_stats(
+    current_user: User = Depends(get_current_active_user)
+):
+    return link_status_store.stats()
+
+@router.get("/http-client")
+def get_http_client_stats(
+    current_user: User = Depends(get_current_active_user)
+):
+    return http_client.stats()
@@ -14,6 +14,14 @@ from models.user import User
 from models.website import Website, WebsiteWithPagesResponse, WebPage
 from typing import List
 from models.website import WebPageRead 
+from models.crawl_job import CrawlJob, CrawlJobRead, JOB_DONE, JOB_FAILED
+from controllers.crawl_jobs import crawl_job_runner
+from controllers.crawl_events import crawl_events
+from config.database import engine
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+import asyncio
+import json
 
 router = APIRouter(prefix="/crawl", tags=["recursive-crawling"])
 
@@ -42,6 +50,77 @@ def crawl_website_recursive(
         logger.log_error("recursive_crawl_error", str(e), current_user.id, website_data.base_url)
         raise HTTPException(status_code=500, detail=f"Recursive crawling failed: {str(e)}")
 
+@router.post("/jobs", response_model=CrawlJobRead, status_code=202)
+def submit_crawl_job(
+    website_data: WebsiteCreate,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_active_user)
+):
+    return crawl_job_runner.submit(website_data, session, current_user)
+
+@router.get("/jobs", response_model=List[CrawlJobRead])
+def get_crawl_jobs(
+    limit: int = 50,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_active_user)
+):
+    return crawl_job_runner.get_user_jobs(session, current_user, limit)
+
+@router.get("/jobs/{job_id}", response_model=CrawlJobRead)
+def get_crawl_job(
+    job_id: int,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_active_user)
+):
+    job = session.get(CrawlJob, job_id)
+    if not job or job.user_id != current_user.id:
+        raise HTTPException(status_code=404, detail="Crawl job not found")
+    return job
+
+@router.get("/jobs/{job_id}/events")
+def stream_crawl_job_events(
+    job_id: int,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Server-Sent Events: current job status, then one event per crawled page until the job ends"""
+    job = session.get(CrawlJob, job_id)
+    if not job or job.user_id != current_user.id:
+        raise HTTPException(status_code=404, detail="Crawl job not found")
+
+    def read_status() -> CrawlJobRead:
+        with Session(engine) as status_session:
+            return CrawlJobRead.model_validate(status_session.get(CrawlJob, job_id))
+
+    async def event_stream():
+        # Subscribe before reading the status so a job finishing in between is not missed
+        queue = crawl_events.subscribe(job_id)
+        try:
+            # SQLite access blocks: keep it off the event loop
+            current = await run_in_threadpool(read_status)
+            yield f"event: status\ndata: {current.model_dump_json()}\n\n"
+            if current.status in (JOB_DONE, JOB_FAILED):
+                return
+
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=15)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+
+                yield f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+                if event["type"] in (JOB_DONE, JOB_FAILED):
+                    return
+        finally:
+            crawl_events.unsubscribe(job_id, queue)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @router.get("/websites/{website_id}/pages")
 def get_website_pages(
     website_id: int,
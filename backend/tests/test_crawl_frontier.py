@@ -0,0 +1,42 @@
+"""
+Sitemap lastmod freshness.
+
+Run from backend/:
+    python -m unittest discover tests
+"""
+import os
+import sys
+import unittest
+from datetime import datetime, timezone
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from config.crawler_config import CrawlerConfig
+from controllers.crawl_frontier import freshness
+
+NOW = datetime(2024, 5, 1, tzinfo=timezone.utc)
+
+
+def expected(age_days: float) -> float:
+    return 0.5 ** (age_days / CrawlerConfig.FRONTIER_FRESHNESS_HALF_LIFE_DAYS)
+
+
+class FreshnessTest(unittest.TestCase):
+    def test_full_dates(self):
+        self.assertEqual(freshness('2024-05-01', NOW), 1.0)
+        self.assertAlmostEqual(freshness('2024-04-30T12:00:00+00:00', NOW), expected(0.5))
+
+    def test_year_and_month_precision(self):
+        self.assertEqual(freshness('2024-05', NOW), 1.0)
+        self.assertAlmostEqual(freshness(' 2024-04 ', NOW), expected(30))
+        self.assertAlmostEqual(freshness('2024', NOW), expected(121))
+
+    def test_missing_or_unparseable(self):
+        for lastmod in (None, '', 'yesterday', '2024-13', '24-05'):
+            self.assertEqual(freshness(lastmod, NOW), 0.0, lastmod)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+"""
+Crawl job recovery when several API processes share the job table.
+
+Run from backend/:
+    python -m unittest discover tests
+"""
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+TEST_DIR = tempfile.TemporaryDirectory()
+os.environ.setdefault('DATABASE_URL', f"sqlite:///{os.path.join(TEST_DIR.name, 'website_audit.db')}")
+
+from sqlmodel import Session
+from config.crawler_config import CrawlerConfig
+from config.database import engine, create_db_and_tables
+from controllers.crawl_jobs import CrawlJobRunner
+from models.crawl_job import CrawlJob, JOB_QUEUED, JOB_RUNNING, JOB_FAILED
+
+
+class CrawlJobRecoveryTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        create_db_and_tables()
+
+    def setUp(self):
+        self.runner = CrawlJobRunner(max_workers=1, worker_id='api-1')
+
+    def tearDown(self):
+        self.runner.shutdown()
+
+    def add_job(self, status: str, worker_id=None, heartbeat_age=None) -> int:
+        heartbeat_at = datetime.utcnow() - timedelta(seconds=heartbeat_age) if heartbeat_age is not None else None
+        with Session(engine) as session:
+            job = CrawlJob(user_id=1, base_url='http://site.test/', request_data='{}', status=status,
+                           worker_id=worker_id, heartbeat_at=heartbeat_at)
+            session.add(job)
+            session.commit()
+            return job.id
+
+    def job(self, job_id: int) -> CrawlJob:
+        with Session(engine) as session:
+            return session.get(CrawlJob, job_id)
+
+    def test_recover_leaves_jobs_of_live_runners_alone(self):
+        stale_age = CrawlerConfig.JOB_STALE_SECONDS + 10
+        own_before_restart = self.add_job(JOB_RUNNING, 'api-1', heartbeat_age=1)
+        other_live = self.add_job(JOB_RUNNING, 'api-2', heartbeat_age=1)
+        other_dead = self.add_job(JOB_RUNNING, 'api-3', heartbeat_age=stale_age)
+        from_older_version = self.add_job(JOB_RUNNING)
+
+        self.runner.recover()
+
+        self.assertEqual(self.job(other_live).status, JOB_RUNNING)
+        for job_id in (own_before_restart, other_dead, from_older_version):
+            self.assertEqual(self.job(job_id).status, JOB_FAILED, job_id)
+        self.assertEqual(self.job(own_before_restart).error, "Interrupted by server restart")
+        self.assertIn('api-3', self.job(other_dead).error)
+
+    def test_queued_job_is_claimed_once(self):
+        job_id = self.add_job(JOB_QUEUED)
+        other = CrawlJobRunner(max_workers=1, worker_id='api-2')
+
+        with Session(engine) as session:
+            self.assertTrue(self.runner._claim(session, job_id))
+            self.assertFalse(other._claim(session, job_id))
+
+        job = self.job(job_id)
+        self.assertEqual((job.status, job.worker_id), (JOB_RUNNING, 'api-1'))
+        self.assertIsNotNone(job.heartbeat_at)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+"""
+Distributed crawl tests: the shared work queue, and several local worker
+processes crawling a site served from this process.
+
+Run from backend/:
+    python -m unittest discover tests
+"""
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Worker processes are spawned and import the backend packages from sys.path
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+# A throwaway database for this process and the workers it spawns (they inherit the environment)
+TEST_DIR = tempfile.TemporaryDirectory()
+os.environ.setdefault('DATABASE_URL', f"sqlite:///{os.path.join(TEST_DIR.name, 'website_audit.db')}")
+
+from sqlmodel import Session, select
+from config.database import engine, create_db_and_tables
+from models.website import WebPage
+from controllers.distributed_crawler import DistributedCrawlCoordinator
+from controllers.work_queue import DONE, FAILED, SQLiteWorkQueue
+
+SITE_PAGES = 10
+
+
+class SiteHandler(BaseHTTPRequestHandler):
+    """Pages /, /p1 ... /p9, each linking to the next two; robots.txt and sitemaps are 404"""
+    gets = Counter()
+    lock = threading.Lock()
+
+    def do_GET(self):
+        with self.lock:
+            self.gets[self.path] += 1
+        self._respond(True)
+
+    def do_HEAD(self):
+        self._respond(False)
+
+    def _respond(self, with_body: bool):
+        index = 0 if self.path == '/' else self._page_index()
+        if index is None:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        links = ''.join(f'<a href="/p{n}">Page {n}</a>' for n in (index + 1, index + 2) if n < SITE_PAGES)
+        body = (f'<html><head><title>Page {index}</title></head>'
+                f'<body><p>Content of page {index}.</p>{links}</body></html>').encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if with_body:
+            self.wfile.write(body)
+
+    def _page_index(self):
+        if self.path.startswith('/p') and self.path[2:].isdigit() and int(self.path[2:]) < SITE_PAGES:
+            return int(self.path[2:])
+        return None
+
+    def log_message(self, *args):
+        pass
+
+
+class WorkQueueTest(unittest.TestCase):
+    def setUp(self):
+        self.workdir = tempfile.TemporaryDirectory()
+        self.queue = SQLiteWorkQueue.create(os.path.join(self.workdir.name, 'queue.db'), 1, 'http://site.test/', 10)
+
+    def tearDown(self):
+        self.queue.close()
+        self.workdir.cleanup()
+
+    def test_push_dedupes(self):
+        self.assertEqual(self.queue.push(['http://site.test/', 'http://site.test/a']), 2)
+        self.assertEqual(self.queue.push(['http://site.test/a', 'http://site.test/b']), 1)
+
+    def test_expired_lease_fails_after_max_attempts(self):
+        self.queue.lease_seconds = 0
+        self.queue.max_attempts = 2
+        self.queue.push(['http://site.test/'])
+
+        self.assertEqual(self.queue.lease('worker-1'), ['http://site.test/'])
+        time.sleep(0.01)
+        # First lease expired: handed out again
+        self.assertEqual(self.queue.lease('worker-2'), ['http://site.test/'])
+        time.sleep(0.01)
+        # Second lease expired too: max_attempts reached, not handed out a third time
+        self.assertEqual(self.queue.lease('worker-3'), [])
+        self.assertEqual(self.queue.counts()[FAILED], 1)
+        self.assertTrue(self.queue.is_finished())
+
+
+class DistributedCrawlTest(unittest.TestCase):
+    def setUp(self):
+        self.workdir = tempfile.TemporaryDirectory()
+        create_db_and_tables()
+
+        SiteHandler.gets.clear()
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), SiteHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f'http://127.0.0.1:{self.server.server_port}/'
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.workdir.cleanup()
+
+    def test_local_workers_crawl_every_page_once(self):
+        queue_path = os.path.join(self.workdir.name, 'queue.db')
+        coordinator = DistributedCrawlCoordinator(queue_path)
+        crawl_id = coordinator.start_crawl(self.base_url, max_pages=50)
+
+        exit_codes = coordinator.run_local_workers(crawl_id, workers=3)
+
+        self.assertEqual(exit_codes, [0, 0, 0])
+        progress = coordinator.progress(crawl_id)
+        self.assertEqual(progress[DONE], SITE_PAGES)
+        self.assertEqual(progress[FAILED], 0)
+
+        with Session(engine) as session:
+            urls = [page.url for page in session.exec(select(WebPage).where(WebPage.website_id == crawl_id))]
+        self.assertEqual(len(urls), SITE_PAGES)
+        self.assertEqual(len(set(urls)), SITE_PAGES)
+
+        # Each page was fetched by exactly one worker
+        page_gets = {path: count for path, count in SiteHandler.gets.items()
+                     if path == '/' or path.startswith('/p')}
+        self.assertEqual(len(page_gets), SITE_PAGES)
+        self.assertTrue(all(count == 1 for count in page_gets.values()), page_gets)
+
+        connection = sqlite3.connect(queue_path)
+        try:
+            workers = {row[0] for row in connection.execute(
+                "SELECT DISTINCT worker FROM crawl_queue WHERE crawl_id = ?", (crawl_id,)
+            )}
+        finally:
+            connection.close()
+        self.assertTrue(workers <= {'local-0', 'local-1', 'local-2'}, workers)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+"""
+Image checks while a host's circuit breaker is open.
+
+Run from backend/:
+    python -m unittest discover tests
+"""
+import io
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+TEST_DIR = tempfile.TemporaryDirectory()
+os.environ.setdefault('DATABASE_URL', f"sqlite:///{os.path.join(TEST_DIR.name, 'website_audit.db')}")
+
+from PIL import Image
+from controllers.image_metadata_cache import ImageMetadataCache
+from controllers.recursive_crawler import IMAGE_NOT_CHECKED, RecursiveCrawler
+from controllers.resilience import CircuitOpenError
+
+
+def wide_banner_png() -> bytes:
+    """1600x300 (a banner by dimensions) of noise, so the PNG is over the 400KB regular-image limit"""
+    buffer = io.BytesIO()
+    Image.frombytes('RGB', (1600, 300), os.urandom(1600 * 300 * 3)).save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+class ImageHandler(BaseHTTPRequestHandler):
+    body = b''
+
+    def do_HEAD(self):
+        self._respond(False)
+
+    def do_GET(self):
+        self._respond(True)
+
+    def _respond(self, with_body: bool):
+        self.send_response(200)
+        self.send_header('Content-Type', 'image/png')
+        self.send_header('Content-Length', str(len(self.body)))
+        self.end_headers()
+        if with_body:
+            self.wfile.write(self.body)
+
+    def log_message(self, *args):
+        pass
+
+
+class CircuitOpenImageCheckTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        ImageHandler.body = wide_banner_png()
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), ImageHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f'http://127.0.0.1:{cls.server.server_port}/'
+        cls.image_url = cls.base_url + 'photo.png'
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.crawler = RecursiveCrawler()
+        self.crawler.image_cache = ImageMetadataCache(persist=False)
+        self.crawler.scheduler.min_interval = 0
+
+    def tearDown(self):
+        self.crawler.close()
+
+    def open_circuit(self):
+        for _ in range(self.crawler.breaker.failure_threshold):
+            self.crawler.breaker.record_failure(self.image_url)
+
+    def probe_dimensions(self):
+        return self.crawler.image_cache.dimensions(
+            self.image_url, {},
+            lambda: RecursiveCrawler.check_image_dimensions(self.image_url, {}, self.crawler.client)
+        )
+
+    def test_dimensions_are_not_cached_while_circuit_is_open(self):
+        self.open_circuit()
+        with self.assertRaises(CircuitOpenError):
+            self.probe_dimensions()
+
+        self.crawler.breaker.record_success(self.image_url)
+        self.assertEqual(self.probe_dimensions()['width'], 1600)
+
+    def test_image_is_unchecked_while_circuit_is_open(self):
+        image = {'src': 'photo.png'}
+        self.open_circuit()
+        self.assertIs(self.crawler._check_image(image, self.image_url, self.base_url, {}), IMAGE_NOT_CHECKED)
+
+        self.crawler.breaker.record_success(self.image_url)
+        # A banner under the 2MB banner limit: not reported as a large regular image
+        self.assertIsNone(self.crawler._check_image(image, self.image_url, self.base_url, {}))
+
+
+if __name__ == '__main__':
+    unittest.main()
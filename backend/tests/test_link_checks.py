@@ -0,0 +1,50 @@
+"""
+Broken link reporting from stored link statuses.
+
+Run from backend/:
+    python -m unittest discover tests
+"""
+import os
+import sys
+import tempfile
+import unittest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+TEST_DIR = tempfile.TemporaryDirectory()
+os.environ.setdefault('DATABASE_URL', f"sqlite:///{os.path.join(TEST_DIR.name, 'website_audit.db')}")
+
+from config.database import create_db_and_tables
+from controllers.link_status_store import link_status_store
+from controllers.recursive_crawler import RecursiveCrawler
+
+# Never requested: the stored status is fresh
+UNREACHABLE_URL = 'http://unreachable.test/gone'
+
+
+class StoredLinkStatusTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        create_db_and_tables()
+
+    def setUp(self):
+        self.crawler = RecursiveCrawler()
+
+    def tearDown(self):
+        self.crawler.close()
+
+    def test_unreachable_link_stored_without_error(self):
+        link_status_store.save(UNREACHABLE_URL, {'status_code': 0})
+        self.assertNotIn('error', link_status_store.get(UNREACHABLE_URL))
+
+        broken_links = self.crawler.check_broken_links([(UNREACHABLE_URL, 'Gone')], 'http://site.test/')
+
+        self.assertEqual(len(broken_links), 1)
+        self.assertEqual(broken_links[0]['status_code'], 0)
+        self.assertEqual(broken_links[0]['error'], '')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+"""
+robots.txt Crawl-delay parsing.
+
+Run from backend/:
+    python -m unittest discover tests
+"""
+import os
+import sys
+import unittest
+from urllib.robotparser import RobotFileParser
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from controllers.robots_cache import RobotsRules, parse_crawl_delays
+
+ROBOTS_TXT = """
+User-agent: Googlebot
+User-agent: bingbot
+Disallow: /search
+Crawl-delay: 0.25
+
+# Everyone else
+User-agent: *
+Crawl-delay: 1.5  # seconds
+Disallow: /private
+
+User-agent: brokenbot
+Crawl-delay: soon
+""".splitlines()
+
+
+class CrawlDelayTest(unittest.TestCase):
+    def rules(self, user_agent: str) -> RobotsRules:
+        parser = RobotFileParser()
+        parser.parse(ROBOTS_TXT)
+        return RobotsRules(parser, user_agent, parse_crawl_delays(ROBOTS_TXT))
+
+    def test_fractional_delays_are_kept(self):
+        self.assertEqual(parse_crawl_delays(ROBOTS_TXT), {'googlebot': 0.25, 'bingbot': 0.25, '*': 1.5})
+
+    def test_delay_of_matching_group(self):
+        self.assertEqual(self.rules('Googlebot/2.1').crawl_delay, 0.25)
+        self.assertEqual(self.rules('*').crawl_delay, 1.5)
+        self.assertEqual(self.rules('OtherBot').crawl_delay, 1.5)
+
+    def test_invalid_delay_falls_back_to_default_group(self):
+        self.assertEqual(self.rules('brokenbot').crawl_delay, 1.5)
+
+    def test_no_delay(self):
+        parser = RobotFileParser()
+        parser.parse(["User-agent: *", "Disallow: /private"])
+        self.assertIsNone(RobotsRules(parser, '*', parse_crawl_delays(["User-agent: *"])).crawl_delay)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+"""
+Sitemap parsing and discovery against a local HTTP server.
+
+Run from backend/:
+    python -m unittest discover tests
+"""
+import os
+import sys
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from controllers.host_scheduler import HostScheduler
+from controllers.robots_cache import RobotsCache, robots_cache
+from controllers.sitemap_parser import SitemapParser
+
+URLSET = (b'<?xml version="1.0" encoding="UTF-8"?>\n'
+          b'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+          b'<url><loc>http://site.test/a</loc><lastmod>2024-05</lastmod><priority>0.8</priority></url>'
+          b'<url><loc>http://site.test/b</loc></url>'
+          b'</urlset>')
+
+FILES = {
+    '/sitemap.xml': URLSET,
+    '/bom.xml': b'\xef\xbb\xbf' + URLSET,
+    '/plain.txt': b'http://site.test/a\nhttp://site.test/b\n',
+    '/bom.txt': b'\xef\xbb\xbfhttp://site.test/a\nhttp://site.test/b\n',
+}
+
+
+class SitemapHandler(BaseHTTPRequestHandler):
+    requests = []
+    lock = threading.Lock()
+
+    def do_HEAD(self):
+        self._respond(False)
+
+    def do_GET(self):
+        self._respond(True)
+
+    def _respond(self, with_body: bool):
+        with self.lock:
+            self.requests.append((time.monotonic(), self.command, self.path))
+        body = FILES.get(self.path)
+        self.send_response(200 if body is not None else 404)
+        self.send_header('Content-Length', str(len(body or b'')))
+        self.end_headers()
+        if with_body and body:
+            self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class SitemapParserTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), SitemapHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f'http://127.0.0.1:{cls.server.server_port}/'
+        FILES['/robots.txt'] = f'User-agent: *\nDisallow: /private\nSitemap: {cls.base_url}bom.xml\n'.encode()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        SitemapHandler.requests.clear()
+
+    def entries(self, path: str):
+        return list(SitemapParser.iter_sitemap(self.base_url + path.lstrip('/')))
+
+    def test_xml_sitemap(self):
+        entries = self.entries('/sitemap.xml')
+        self.assertEqual([entry['loc'] for entry in entries], ['http://site.test/a', 'http://site.test/b'])
+        self.assertEqual(entries[0]['lastmod'], '2024-05')
+        self.assertEqual(entries[0]['priority'], 0.8)
+
+    def test_xml_sitemap_with_byte_order_mark(self):
+        self.assertEqual([entry['loc'] for entry in self.entries('/bom.xml')],
+                         ['http://site.test/a', 'http://site.test/b'])
+
+    def test_text_sitemaps(self):
+        for path in ('/plain.txt', '/bom.txt'):
+            self.assertEqual([entry['loc'] for entry in self.entries(path)],
+                             ['http://site.test/a', 'http://site.test/b'], path)
+
+    def test_discovery_is_paced_and_uses_the_given_robots_cache(self):
+        robots = RobotsCache()
+        scheduler = HostScheduler(0.1)
+
+        sitemap_urls = SitemapParser.find_sitemap_urls(self.base_url, scheduler=scheduler, robots=robots)
+
+        self.assertEqual(sitemap_urls, [self.base_url + 'bom.xml', self.base_url + 'sitemap.xml'])
+        self.assertEqual(robots.get(self.base_url).sitemaps, [self.base_url + 'bom.xml'])
+        self.assertNotIn(f'127.0.0.1:{self.server.server_port}', robots_cache._rules)
+
+        # robots.txt and four probes, one scheduler slot apart
+        times = sorted(sent for sent, _, _ in SitemapHandler.requests)
+        self.assertEqual(len(times), 5)
+        gaps = [later - earlier for earlier, later in zip(times, times[1:])]
+        self.assertGreater(min(gaps), 0.08, gaps)
+
+
+if __name__ == '__main__':
+    unittest.main()